@@ -1,12 +1,15 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Optional, Dict
+from datetime import datetime
+from functools import lru_cache
+from operator import itemgetter
+from typing import Optional
 import sys
 from pathlib import Path
 
 from PySide6.QtCore import Qt
-from PySide6.QtGui import QIntValidator, QIcon, QColor
+from PySide6.QtGui import QIntValidator, QIcon
 from PySide6.QtWidgets import (
     QWidget,
     QFormLayout,
@@ -20,8 +23,8 @@ from PySide6.QtWidgets import (
     QLabel,
     QFrame,
     QSizePolicy,
-    QGraphicsDropShadowEffect,
     QDialog,
+    QFileDialog,
 )
 
 from style import (
@@ -32,8 +35,58 @@ from style import (
 
 from config import SETORES as SETORES_GLOBAIS
 
+# QSS da página composto uma vez (cabeçalho antes do formulário, mesma precedência de antes)
+_QSS_PAGINA = QSS_HEADER_BLOQUEADO + QSS_FORMULARIO_BASE
+
+# Opções fixas dos combos (montadas uma vez por processo)
+_MOTIVOS_EXPORT: tuple[str, ...] = (
+    "Armazenamento inadequado",
+    "Armazenamento fora do sistema",
+    "Movimentação apenas fisica",
+    "Movimentação apenas sistemica",
+    "Não movimentado do Box de recebimento",
+    "Perca do produto pós recebimento",
+    "Produto com avaria",
+    "Expedição irregular",
+    "Entrada do inventário",
+    "Outros",
+)
+
+# Colunas exportadas (inclui matrícula e data da movimentação) e extrator de valores
+# na mesma ordem: uma única chamada em C por linha em vez de nove r.get()
+_CABECALHO_EXPORT: tuple[str, ...] = (
+    "id", "item", "quantidade", "motivo", "setor", "matricula", "data_mov", "usuario", "created_at",
+)
+_valores_export = itemgetter(
+    "id", "item", "quantidade", "motivo", "setor_responsavel", "matricula", "data_mov", "usuario", "created_at",
+)
+
+_MOTIVOS_PADRAO: tuple[str, ...] = (
+    "-- Selecione --",
+    "Armazenamento inadequado",
+    "Armazenamento fora do sistema",
+    "Movimentação inadequado",
+    "Movimentação apenas fisica",
+    "Movimentação apenas sistemica",
+    "Ressuprimento irregular",
+    "Separação incorreta",
+    "Perca no manuseio",
+    "Recebido trocado",
+    "Não movimentado do Box de recebimento",
+    "Perca do produto pós recebimento",
+    "Produto com avaria",
+    "Expedição irregular",
+    "Entrada inrreegular",
+    "Erro de contagem",
+    "Antenas consumo interno",
+    "Outros",
+)
+# Lista fechada (combo não editável): "Outros" é identificado pelo índice
+_IDX_OUTROS = _MOTIVOS_PADRAO.index("Outros")
+
 
 # Utilitário local (evita import circular com servidor.py)
+@lru_cache(maxsize=32)
 def _resource_path(rel_path: str) -> str:
     base = getattr(sys, "_MEIPASS", None)
     if base:
@@ -41,7 +94,9 @@ def _resource_path(rel_path: str) -> str:
     return str(Path(__file__).resolve().parent / rel_path)
 
 
+@lru_cache(maxsize=1)
 def _get_app_icon() -> QIcon:
+    # Resolvido uma vez por processo (sem stat() a cada diálogo aberto)
     for c in ("assets/app_icon.ico", "assets/app_icon.png", "assets/app_icon.svg"):
         p = Path(_resource_path(c))
         if p.exists():
@@ -49,6 +104,12 @@ def _get_app_icon() -> QIcon:
     return QIcon()
 
 
+@lru_cache(maxsize=8)
+def _validador_int(minimo: int, maximo: int) -> QIntValidator:
+    """Validador compartilhado por faixa (sem estado; o QLineEdit não assume a posse)."""
+    return QIntValidator(minimo, maximo)
+
+
 @dataclass(slots=True)
 class Registro:
     item: int
@@ -96,19 +157,7 @@ class ExportDialog(QDialog):
         self.chk_data_fim.toggled.connect(self.ed_data_fim.setEnabled)
         # Motivo via lista ("Outros" = Todos)
         self.cb_motivo = QComboBox()
-        motivos: list = [
-            "Armazenamento inadequado",
-            "Armazenamento fora do sistema",
-            "Movimentação apenas fisica",
-            "Movimentação apenas sistemica",
-            "Não movimentado do Box de recebimento",
-            "Perca do produto pós recebimento",
-            "Produto com avaria",
-            "Expedição irregular",
-            "Entrada do inventário",
-            "Outros",
-        ]
-        self.cb_motivo.addItems(motivos)
+        self.cb_motivo.addItems(_MOTIVOS_EXPORT)
         # Formato
         self.cb_formato = QComboBox()
         self.cb_formato.addItems(["csv", "xlsx", "txt"])
@@ -215,14 +264,6 @@ class BloqueadoPage(QWidget):
         wrap_layout.addWidget(titulo_container)
         wrap_layout.addWidget(line_right)
         head_layout.addWidget(titulo_wrap, 0, Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter)
-        try:
-            _title_shadow = QGraphicsDropShadowEffect(self)
-            _title_shadow.setBlurRadius(20)
-            _title_shadow.setOffset(0, 2)
-            _title_shadow.setColor(QColor(0, 0, 0, 70))
-            lab_titulo.setGraphicsEffect(_title_shadow)
-        except Exception:
-            pass
         head_layout.addStretch(1)
         self.btn_help_bloq = QPushButton("❓ Ajuda")
         self.btn_help_bloq.setObjectName("HelpBloqueado")
@@ -239,15 +280,8 @@ class BloqueadoPage(QWidget):
         self.btn_help_bloq.clicked.connect(self._mostrar_ajuda_bloqueado)
         head_layout.addWidget(self.btn_help_bloq, 0, Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignTop)
         root_layout.addWidget(head_frame)
-        try:
-            shadow = QGraphicsDropShadowEffect(self)
-            shadow.setBlurRadius(18)
-            shadow.setOffset(0, 4)
-            shadow.setColor(QColor(0, 0, 0, 60))
-            head_frame.setGraphicsEffect(shadow)
-        except Exception:
-            pass
-        self.setStyleSheet(self.styleSheet() + QSS_HEADER_BLOQUEADO)
+        # Sem QGraphicsDropShadowEffect: o "relevo" do cabeçalho vem do QSS
+        # (borda inferior), evitando o blur offscreen a cada repaint
 
         form_layout = QFormLayout()
         form_layout.setLabelAlignment(Qt.AlignmentFlag.AlignRight)
@@ -257,21 +291,21 @@ class BloqueadoPage(QWidget):
         # Campo: Item (código)
         self.campo_item = QLineEdit()
         self.campo_item.setPlaceholderText("Ex: 2222223")
-        self.campo_item.setValidator(QIntValidator(1, 10_000_000, self))
+        self.campo_item.setValidator(_validador_int(1, 10_000_000))
         self.campo_item.setClearButtonEnabled(True)
         form_layout.addRow("&Item (cód.):", self.campo_item)
 
         # Campo: Quantidade
         self.campo_quantidade = QLineEdit()
         self.campo_quantidade.setPlaceholderText("Ex: 150")
-        self.campo_quantidade.setValidator(QIntValidator(1, 1_000_000, self))
+        self.campo_quantidade.setValidator(_validador_int(1, 1_000_000))
         self.campo_quantidade.setClearButtonEnabled(True)
         form_layout.addRow("&Quantidade:", self.campo_quantidade)
 
         # Campo: Matrícula
         self.campo_matricula = QLineEdit()
         self.campo_matricula.setPlaceholderText("Responsável pela Movimentação / Erro")
-        self.campo_matricula.setValidator(QIntValidator(1, 99_999_999, self))
+        self.campo_matricula.setValidator(_validador_int(1, 99_999_999))
         self.campo_matricula.setClearButtonEnabled(True)
         lab_matricula = QLabel("Matrícula:")
         lab_matricula.setToolTip("Matrícula do responsável pela movimentação ou erro.")
@@ -290,27 +324,7 @@ class BloqueadoPage(QWidget):
         # Observação (combo + texto)
         self.cb_motivo_padrao = QComboBox()
         self.cb_motivo_padrao.setObjectName("ComboMotivoPadrao")
-        motivos_padrao: list = [
-            "-- Selecione --",
-            "Armazenamento inadequado",
-            "Armazenamento fora do sistema",
-            "Movimentação inadequado",
-            "Movimentação apenas fisica",
-            "Movimentação apenas sistemica",
-            "Ressuprimento irregular",
-            "Separação incorreta",
-            "Perca no manuseio",
-            "Recebido trocado",
-            "Não movimentado do Box de recebimento",
-            "Perca do produto pós recebimento",
-            "Produto com avaria",
-            "Expedição irregular",
-            "Entrada inrreegular",
-            "Erro de contagem",
-            "Antenas consumo interno",
-            "Outros",
-        ]
-        self.cb_motivo_padrao.addItems(motivos_padrao)
+        self.cb_motivo_padrao.addItems(_MOTIVOS_PADRAO)
         self.campo_motivo = QTextEdit()
         self.campo_motivo.setPlaceholderText("Selecione um motivo padrão ou 'Outros' para digitar...")
         self.campo_motivo.setAcceptRichText(False)
@@ -360,9 +374,12 @@ class BloqueadoPage(QWidget):
 
     def _aplicar_tema(self) -> None:
         from PySide6.QtWidgets import QApplication
-        QApplication.setStyle("Fusion")
+        # Trocar o estilo re-polisha a aplicação inteira: só quando ainda não é Fusion
+        if QApplication.style().name().lower() != "fusion":
+            QApplication.setStyle("Fusion")
         self.setPalette(build_palette_claro())
-        self.setStyleSheet(self.styleSheet() + QSS_FORMULARIO_BASE)
+        # Cabeçalho + formulário aplicados num único setStyleSheet (um parse/polish)
+        self.setStyleSheet(_QSS_PAGINA)
         self.botao_exportar.setObjectName("danger")
 
     # ------------------------- Lógica ------------------------- #
@@ -388,10 +405,9 @@ class BloqueadoPage(QWidget):
         texto_mot = self.campo_motivo.toPlainText().strip()
         if idx_mot <= 0:  # placeholder
             return "Observação é obrigatória (selecione ou escolha 'Outros')."
-        rotulo_sel = self.cb_motivo_padrao.currentText()
-        if rotulo_sel == "Outros" and not texto_mot:
-            return "Digite a observação em 'Outros'."
-        if rotulo_sel != "Outros" and not texto_mot:
+        if not texto_mot:
+            if idx_mot == _IDX_OUTROS:
+                return "Digite a observação em 'Outros'."
             return "Observação inválida."
         if self.campo_setor.currentIndex() <= 0:
             return "Selecione um Setor."
@@ -448,11 +464,14 @@ class BloqueadoPage(QWidget):
             self._mostrar_feedback(f"Falha ao salvar: {exc}", erro_flag=True)
 
     def _mostrar_feedback(self, mensagem: str, erro_flag: bool) -> None:
-        self.feedback.setProperty("erro", "true" if erro_flag else "false")
+        erro = "true" if erro_flag else "false"
+        # Re-polish (seletor [erro="..."] do QSS) só quando o estado muda
+        if self.feedback.property("erro") != erro:
+            self.feedback.setProperty("erro", erro)
+            self.feedback.style().unpolish(self.feedback)
+            self.feedback.style().polish(self.feedback)
         self.feedback.setText(mensagem)
         self.feedback.setVisible(True)
-        self.feedback.style().unpolish(self.feedback)
-        self.feedback.style().polish(self.feedback)
         if erro_flag:
             if "Item" in mensagem:
                 self.campo_item.setFocus()
@@ -465,17 +484,16 @@ class BloqueadoPage(QWidget):
 
     def _on_motivo_padrao_changed(self) -> None:
         idx = self.cb_motivo_padrao.currentIndex()
-        texto = self.cb_motivo_padrao.currentText()
         if idx <= 0:  # placeholder
             self.campo_motivo.clear()
             self.campo_motivo.setEnabled(False)
-        elif texto == "Outros":
+        elif idx == _IDX_OUTROS:
             self.campo_motivo.clear()
             self.campo_motivo.setEnabled(True)
             self.campo_motivo.setFocus()
         else:
             self.campo_motivo.setEnabled(False)
-            self.campo_motivo.setPlainText(texto)
+            self.campo_motivo.setPlainText(_MOTIVOS_PADRAO[idx])
 
     def _abrir_exportacao(self) -> None:
         dlg = ExportDialog(parent=self)
@@ -495,9 +513,7 @@ class BloqueadoPage(QWidget):
                 QMessageBox.information(self, "Exportação", "Nenhum registro para os filtros.")
                 return
             # Escolher arquivo
-            from datetime import datetime
             padrao_nome = f"registros_{datetime.utcnow().strftime('%Y%m%d_%H%M%S')}.{params.get('formato','csv')}"
-            from PySide6.QtWidgets import QFileDialog
             arquivo, _ = QFileDialog.getSaveFileName(self, "Salvar Exportação", padrao_nome, "Arquivos (*.*)")
             if not arquivo:
                 return
@@ -512,39 +528,24 @@ class BloqueadoPage(QWidget):
         formato = (formato or "csv").lower()
         if formato == "csv":
             import csv
-            with open(caminho, "w", newline="", encoding="utf-8") as f:
+            with open(caminho, "w", newline="", encoding="utf-8", buffering=1 << 20) as f:
                 w = csv.writer(f, delimiter=';')
-                # Inclui matrícula e Data da movimentação
-                w.writerow(["id", "item", "quantidade", "motivo", "setor", "matricula", "data_mov", "usuario", "created_at"])
-                for r in registros:
-                    w.writerow([
-                        r.get("id", ""), r.get("item", ""), r.get("quantidade", ""), r.get("motivo", ""), r.get("setor_responsavel", ""), r.get("matricula", ""), r.get("data_mov", ""), r.get("usuario") or "", r.get("created_at", "")
-                    ])
+                w.writerow(_CABECALHO_EXPORT)
+                # writerows consome o gerador em C; None (ex.: usuario) sai como campo vazio
+                w.writerows(map(_valores_export, registros))
         elif formato == "xlsx":
-            from openpyxl import Workbook
-            wb = Workbook()
-            ws = wb.active
-            # Inclui matrícula e Data da movimentação
-            ws.append(["id", "item", "quantidade", "motivo", "setor", "matricula", "data_mov", "usuario", "created_at"])
-            for r in registros:
-                ws.append([
-                    r.get("id", ""), r.get("item", ""), r.get("quantidade", ""), r.get("motivo", ""), r.get("setor_responsavel", ""), r.get("matricula", ""), r.get("data_mov", ""), r.get("usuario") or "", r.get("created_at", "")
-                ])
+            from openpyxl import Workbook  # import local: só quem exporta xlsx paga o custo
+            # write_only grava as linhas em fluxo (memória constante, sem células por objeto)
+            wb = Workbook(write_only=True)
+            ws = wb.create_sheet()
+            ws.append(_CABECALHO_EXPORT)
+            for valores in map(_valores_export, registros):
+                ws.append(valores)
             wb.save(caminho)
         elif formato == "txt":
             with open(caminho, "w", encoding="utf-8") as f:
-                for r in registros:
-                    f.write("\t".join([
-                        str(r.get('id','')),
-                        str(r.get('item','')),
-                        str(r.get('quantidade','')),
-                        str(r.get('motivo','')),
-                        str(r.get('setor_responsavel','')),
-                        str(r.get('matricula','')),
-                        str(r.get('data_mov','')),
-                        str(r.get('usuario','') or ''),
-                        str(r.get('created_at','')),
-                    ]) + "\n")
+                for valores in map(_valores_export, registros):
+                    f.write("\t".join("" if v is None else str(v) for v in valores) + "\n")
         else:
             raise ValueError("Formato não suportado. Use csv, xlsx ou txt.")
 
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from collections import OrderedDict
 from time import time
 from typing import Optional
 from pathlib import Path
@@ -88,8 +89,8 @@ class ConsultasPage(QWidget):
     def __init__(self, parent: Optional[QWidget] = None) -> None:
         super().__init__(parent)
         self.setObjectName("PaginaConsultas")
-        # cache simples p/ item
-        self._consulta_cache: dict[int, tuple[float, list[dict]]] = {}
+        # cache LRU p/ item (item -> (timestamp, registros)); mais recente no fim
+        self._consulta_cache: OrderedDict[int, tuple[float, list[dict]]] = OrderedDict()
         self._consulta_cache_ttl = 120.0
         self._consulta_cache_max = 50
         self._ultimos_resultados_consulta: list[dict] = []
@@ -311,6 +312,7 @@ class ConsultasPage(QWidget):
         if entry and (now_ts - entry[0]) < self._consulta_cache_ttl:
             regs = entry[1]
             cache_hit = True
+            self._consulta_cache.move_to_end(item_cod)
         else:
             from database import consultar_registros_por_item
             try:
@@ -319,9 +321,9 @@ class ConsultasPage(QWidget):
                 self.lab_status_consulta.setText(str(exc))
                 return
             self._consulta_cache[item_cod] = (now_ts, regs)
-            if len(self._consulta_cache) > self._consulta_cache_max:
-                mais_antigo = min(self._consulta_cache.items(), key=lambda kv: kv[1][0])[0]
-                self._consulta_cache.pop(mais_antigo, None)
+            self._consulta_cache.move_to_end(item_cod)
+            while len(self._consulta_cache) > self._consulta_cache_max:
+                self._consulta_cache.popitem(last=False)
         self._popular_tabela_consultas(regs)
         self._ultimos_resultados_consulta = regs
         if regs:
@@ -76,6 +76,26 @@ except Exception:
 
 
 engine = create_engine(os.getenv("DATABASE_URL", "sqlite:///dados.db"), future=True, echo=False)
+
+
+@event.listens_for(engine, "connect")
+def _sqlite_pragmas(dbapi_conn, _record):  # pragma: no cover - depende do backend
+    """Ajusta cada conexão SQLite nova do pool (aplicado uma vez por conexão, não por consulta).
+
+    WAL deixa leituras concorrentes com a escrita. O modo fica gravado no próprio arquivo .db,
+    por isso SQLITE_WAL=0 (arquivo em compartilhamento de rede, onde WAL não funciona) volta
+    explicitamente para o journal padrão (DELETE) em vez de só deixar de ativar o WAL.
+    """
+    if engine.url.get_backend_name() != "sqlite" or engine.url.database in (None, "", ":memory:"):
+        return
+    modo = "DELETE" if (os.getenv("SQLITE_WAL") or "1").strip() == "0" else "WAL"
+    cur = dbapi_conn.cursor()
+    try:
+        cur.execute(f"PRAGMA journal_mode={modo}")
+    finally:
+        cur.close()
+
+
 SessionLocal = sessionmaker(bind=engine, expire_on_commit=False, autoflush=False, autocommit=False, future=True)
 
 Base = declarative_base()
@@ -1,9 +1,9 @@
 from __future__ import annotations
 
-from typing import Optional, List, Dict
+from typing import Optional, List, Dict, Tuple
 
-from PySide6.QtCore import Qt, QDate, QRegularExpression
-from PySide6.QtGui import QIntValidator, QRegularExpressionValidator, QColor
+from PySide6.QtCore import Qt, QDate, QRegularExpression, QObject, QRunnable, QThreadPool, Signal
+from PySide6.QtGui import QIntValidator, QRegularExpressionValidator, QColor, QFont
 from PySide6.QtWidgets import (
 	QWidget,
 	QVBoxLayout,
@@ -36,17 +36,40 @@ from database import (
 )
 
 
+# Remove espaços do valor digitado numa única passada
+_TRANS_VALOR = str.maketrans({" ": None})
+
+# Valor aceita 123, 123.45, 123,45 — compilado uma única vez para todas as páginas
+_VALOR_RE = QRegularExpression(r"^\d{1,9}([\.,]\d{1,2})?$")
+_VALOR_RE.optimize()
+
+# Alinhamento das células de itens, calculado uma vez
+_ALIGN_LEFT = Qt.AlignVCenter | Qt.AlignLeft
+
+# Destaque das linhas "Em andamento", compartilhado por todos os itens (copy-on-write no Qt)
+try:
+	_COR_EM_ANDAMENTO = QColor("#FFF59D")  # amarelo claro
+	_FONTE_NEGRITO = QFont()
+	_FONTE_NEGRITO.setBold(True)
+except Exception:
+	_COR_EM_ANDAMENTO = None
+	_FONTE_NEGRITO = None
+
+
 class _IntDelegate(QStyledItemDelegate):
-	"""Delegate para edição com QLineEdit + QIntValidator."""
+	"""Delegate para edição com QLineEdit + QIntValidator.
+
+	Uma única instância atende várias colunas: `faixas` mapeia coluna -> (mínimo, máximo).
+	"""
 
-	def __init__(self, parent=None, minimo: int = 1, maximo: int = 9_999_999):
+	def __init__(self, parent=None, faixas: Optional[Dict[int, Tuple[int, int]]] = None):
 		super().__init__(parent)
-		self._min = minimo
-		self._max = maximo
+		self._faixas = dict(faixas or {})
 
 	def createEditor(self, parent, option, index):
+		minimo, maximo = self._faixas.get(index.column(), (1, 9_999_999))
 		ed = QLineEdit(parent)
-		ed.setValidator(QIntValidator(self._min, self._max, ed))
+		ed.setValidator(QIntValidator(minimo, maximo, ed))
 		# Mantém o editor com aparência padrão, sem bordas arredondadas
 		ed.setStyleSheet("border-radius:0; padding:0px; margin:0px;")
 		return ed
@@ -99,9 +122,11 @@ class ItensDialog(QDialog):
 		try:
 			from PySide6.QtWidgets import QHeaderView
 			hdr = self.tab.horizontalHeader()
-			hdr.setStretchLastSection(True)
-			hdr.setSectionResizeMode(QHeaderView.Stretch)
 			hdr.setMinimumSectionSize(120)
+			# Larguras fixas: evita recalcular colunas a cada linha inserida
+			hdr.setSectionResizeMode(QHeaderView.Fixed)
+			hdr.resizeSection(0, 240)
+			hdr.setStretchLastSection(True)
 		except Exception:
 			pass
 		self.tab.verticalHeader().setVisible(False)
@@ -118,9 +143,10 @@ class ItensDialog(QDialog):
 		it1.setToolTip("Quantidade (inteiro >= 1)")
 		self.tab.setHorizontalHeaderItem(0, it0)
 		self.tab.setHorizontalHeaderItem(1, it1)
-		# Delegates de validação
-		self.tab.setItemDelegateForColumn(0, _IntDelegate(self, 1_000, 9_999_999))
-		self.tab.setItemDelegateForColumn(1, _IntDelegate(self, 1, 9_999_999))
+		# Delegate de validação (Código >= 1000, Quantidade >= 1), compartilhado pelas duas colunas
+		self._delegate = _IntDelegate(self, {0: (1_000, 9_999_999), 1: (1, 9_999_999)})
+		for col in (0, 1):
+			self.tab.setItemDelegateForColumn(col, self._delegate)
 		# Estilo da tabela
 		self.tab.setStyleSheet(
 			"""
@@ -158,24 +184,42 @@ class ItensDialog(QDialog):
 			pass
 
 		# Preload itens
-		for it in itens:
-			self._adicionar(codigo=it.get("codigo_item"), qtd=it.get("quantidade", 0))
-		self._atualizar_contador()
+		self.set_itens(itens)
 
 		box = QDialogButtonBox(QDialogButtonBox.Ok | QDialogButtonBox.Cancel)
 		box.accepted.connect(self._on_accept)
 		box.rejected.connect(self.reject)
 		root.addWidget(box)
 
-	def _adicionar(self, *, codigo: Optional[int] = None, qtd: Optional[int] = None) -> None:
+	def set_itens(self, itens: List[Dict]) -> None:
+		"""Substitui as linhas da tabela pelos itens informados (permite reutilizar o diálogo)."""
+		# Sem sinais/repaint por linha; contador e estado são atualizados uma única vez ao final
+		ordenacao = self.tab.isSortingEnabled()
+		self.tab.blockSignals(True)
+		self.tab.setUpdatesEnabled(False)
+		self.tab.setSortingEnabled(False)
+		try:
+			self.tab.setRowCount(0)
+			for it in itens:
+				self._adicionar(codigo=it.get("codigo_item"), qtd=it.get("quantidade", 0), _bulk=True)
+		finally:
+			self.tab.setSortingEnabled(ordenacao)
+			self.tab.setUpdatesEnabled(True)
+			self.tab.blockSignals(False)
+		self._atualizar_contador()
+		self._atualizar_estado()
+
+	def _adicionar(self, *, codigo: Optional[int] = None, qtd: Optional[int] = None, _bulk: bool = False) -> None:
 		r = self.tab.rowCount()
 		self.tab.insertRow(r)
 		it_cod = QTableWidgetItem(str(codigo or ""))
-		it_cod.setTextAlignment(Qt.AlignVCenter | Qt.AlignLeft)
+		it_cod.setTextAlignment(_ALIGN_LEFT)
 		it_qtd = QTableWidgetItem(str(qtd or 1))
-		it_qtd.setTextAlignment(Qt.AlignVCenter | Qt.AlignLeft)
+		it_qtd.setTextAlignment(_ALIGN_LEFT)
 		self.tab.setItem(r, 0, it_cod)
 		self.tab.setItem(r, 1, it_qtd)
+		if _bulk:
+			return
 		self._atualizar_contador()
 		self._atualizar_estado()
 
@@ -237,6 +281,41 @@ class ItensDialog(QDialog):
 		self.btn_del.setEnabled(self.tab.currentRow() >= 0)
 
 
+class _CargaSinais(QObject):
+	"""Sinais do carregamento em segundo plano (entregues na thread da GUI)."""
+
+	concluido = Signal(object)  # (ok, rows | exceção)
+
+
+class _CarregarSenhasTask(QRunnable):
+	"""Executa listar_senhas_em_andamento() fora da thread da GUI.
+
+	Cada registro já é entregue como tupla de textos na ordem das colunas
+	(ID, Ordem, Carga, Data, Usuário, Tipo), convertida aqui mesmo na thread de trabalho.
+	"""
+
+	def __init__(self) -> None:
+		super().__init__()
+		self.sinais = _CargaSinais()
+
+	def run(self) -> None:
+		try:
+			linhas = [
+				(
+					str(r.get("id")),
+					str(r.get("ordem")),
+					str(r.get("carga")),
+					str(r.get("data_ordem")),
+					str(r.get("usuario") or ""),
+					str(r.get("tipo_tratativa")),
+				)
+				for r in listar_senhas_em_andamento()
+			]
+			self.sinais.concluido.emit((True, linhas))
+		except Exception as e:
+			self.sinais.concluido.emit((False, e))
+
+
 # === Item numérico para permitir sorting correto nas colunas ID / Ordem / Carga ===
 class _IntSortItem(QTableWidgetItem):  # type: ignore[name-defined]
     def __init__(self, value):
@@ -264,6 +343,7 @@ class TratativasDialog(QDialog):
 		super().__init__(parent)
 		self.setWindowTitle("Tratativas — Senhas em andamento")
 		self.resize(780, 440)
+		self._task: Optional[_CarregarSenhasTask] = None
 		self._build()
 
 	def _build(self) -> None:
@@ -298,11 +378,21 @@ class TratativasDialog(QDialog):
 		try:
 			from PySide6.QtWidgets import QHeaderView
 			hdr = self.tab.horizontalHeader()
+			# Larguras fixas por coluna (ID, Ordem, Carga, Data, Usuário); Tipo ocupa o restante
+			hdr.setSectionResizeMode(QHeaderView.Fixed)
+			for col, largura in {0: 60, 1: 110, 2: 110, 3: 110, 4: 170}.items():
+				hdr.resizeSection(col, largura)
 			hdr.setStretchLastSection(True)
-			hdr.setSectionResizeMode(QHeaderView.Stretch)
 		except Exception:
 			pass
 		self.tab.verticalHeader().setVisible(False)
+		# Lista somente leitura: linhas de altura uniforme, sem quebra de texto nem cores alternadas
+		self.tab.verticalHeader().setSectionResizeMode(QHeaderView.Fixed)
+		self.tab.verticalHeader().setDefaultSectionSize(22)
+		self.tab.setAlternatingRowColors(False)
+		self.tab.setWordWrap(False)
+		self.tab.setShowGrid(False)
+		self.tab.setTextElideMode(Qt.ElideRight)
 		self.tab.setSelectionBehavior(QAbstractItemView.SelectRows)
 		self.tab.setSelectionMode(QAbstractItemView.SingleSelection)
 		self.tab.setEditTriggers(QAbstractItemView.NoEditTriggers)
@@ -342,36 +432,58 @@ class TratativasDialog(QDialog):
 
 		self._carregar()
 
+	def reabrir(self) -> None:
+		"""Limpa filtros e lista antes de recarregar, como num diálogo recém-criado."""
+		for w in (self.filtro_ordem, self.filtro_carga):
+			w.blockSignals(True)
+			w.clear()
+			w.blockSignals(False)
+		self.tab.setRowCount(0)
+		self._carregar()
+
 	def _carregar(self) -> None:
-		try:
-			rows = listar_senhas_em_andamento()
-		except Exception as e:
+		"""Dispara a consulta em segundo plano; a tabela é preenchida em _on_carregado."""
+		if self._task is not None:
+			return
+		self.btn_recarregar.setEnabled(False)
+		self.btn_recarregar.setText("Carregando…")
+		self._task = _CarregarSenhasTask()
+		self._task.sinais.concluido.connect(self._on_carregado)
+		QThreadPool.globalInstance().start(self._task)
+
+	def _on_carregado(self, resultado: tuple) -> None:
+		self._task = None
+		self.btn_recarregar.setText("Recarregar")
+		self.btn_recarregar.setEnabled(True)
+		ok, payload = resultado
+		if ok:
+			rows = payload
+		else:
 			rows = []
-			QMessageBox.critical(self, "Erro", f"Falha ao carregar: {e}")
+			QMessageBox.critical(self, "Erro", f"Falha ao carregar: {payload}")
 		self.tab.setSortingEnabled(False)
 		self.tab.setRowCount(0)
-		for r in rows:
-			rr = self.tab.rowCount()
-			self.tab.insertRow(rr)
-			# Colunas numéricas com item especial para ordenar
-			self.tab.setItem(rr, 0, _IntSortItem(r.get("id")))
-			self.tab.setItem(rr, 1, _IntSortItem(r.get("ordem")))
-			self.tab.setItem(rr, 2, _IntSortItem(r.get("carga")))
-			self.tab.setItem(rr, 3, QTableWidgetItem(str(r.get("data_ordem"))))
-			self.tab.setItem(rr, 4, QTableWidgetItem(str(r.get("usuario") or "")))
-			tipo_txt = str(r.get("tipo_tratativa"))
+		self.tab.setRowCount(len(rows))
+		for rr, (sid, ordem, carga, data_ordem, usuario, tipo_txt) in enumerate(rows):
 			tipo_item = QTableWidgetItem(tipo_txt)
 			if tipo_txt == "Em andamento":
-				try:
-					# Destaque visual para indicar ação
-					tipo_item.setBackground(QColor("#FFF59D"))  # amarelo claro
-					f = tipo_item.font()
-					f.setBold(True)
-					tipo_item.setFont(f)
-				except Exception:
-					pass
+				# Destaque visual para indicar ação
+				if _COR_EM_ANDAMENTO is not None:
+					tipo_item.setBackground(_COR_EM_ANDAMENTO)
+				if _FONTE_NEGRITO is not None:
+					tipo_item.setFont(_FONTE_NEGRITO)
 				tipo_item.setToolTip("Dê duplo clique para editar o tipo e adicionar observação.")
-			self.tab.setItem(rr, 5, tipo_item)
+			itens = (
+				# Colunas numéricas com item especial para ordenar
+				_IntSortItem(sid),
+				_IntSortItem(ordem),
+				_IntSortItem(carga),
+				QTableWidgetItem(data_ordem),
+				QTableWidgetItem(usuario),
+				tipo_item,
+			)
+			for c, it in enumerate(itens):
+				self.tab.setItem(rr, c, it)
 		self.tab.setSortingEnabled(True)
 		# Reaplica filtros se já havia texto
 		self._aplicar_filtros()
@@ -380,18 +492,25 @@ class TratativasDialog(QDialog):
 		"""Mostra/oculta linhas conforme filtros de Ordem e Carga."""
 		f_ord = self.filtro_ordem.text().strip()
 		f_carga = self.filtro_carga.text().strip()
-		linhas = self.tab.rowCount()
-		for r in range(linhas):
-			mostrar = True
-			if f_ord:
-				it_ord = self.tab.item(r, 1)
-				if not it_ord or f_ord not in it_ord.text():
-					mostrar = False
-			if mostrar and f_carga:
-				it_carga = self.tab.item(r, 2)
-				if not it_carga or f_carga not in it_carga.text():
-					mostrar = False
-			self.tab.setRowHidden(r, not mostrar)
+		tab = self.tab
+		# Filtra sobre as linhas já carregadas, sem nova consulta ao banco;
+		# só altera a visibilidade das linhas cujo estado muda
+		tab.setUpdatesEnabled(False)
+		try:
+			for r in range(tab.rowCount()):
+				mostrar = True
+				if f_ord:
+					it_ord = tab.item(r, 1)
+					if not it_ord or f_ord not in it_ord.text():
+						mostrar = False
+				if mostrar and f_carga:
+					it_carga = tab.item(r, 2)
+					if not it_carga or f_carga not in it_carga.text():
+						mostrar = False
+				if tab.isRowHidden(r) == mostrar:
+					tab.setRowHidden(r, not mostrar)
+		finally:
+			tab.setUpdatesEnabled(True)
 
 	def _on_cell_double_clicked(self, row: int, column: int) -> None:
 		# Edita apenas se a coluna for 'Tipo'
@@ -456,8 +575,10 @@ class TratativasDialog(QDialog):
 		try:
 			from PySide6.QtWidgets import QHeaderView
 			hdr = tab.horizontalHeader()
+			hdr.setSectionResizeMode(QHeaderView.Fixed)
+			hdr.resizeSection(0, 170)
+			hdr.resizeSection(1, 130)
 			hdr.setStretchLastSection(True)
-			hdr.setSectionResizeMode(QHeaderView.Stretch)
 		except Exception:
 			pass
 		for r, it in enumerate(itens):
@@ -538,6 +659,9 @@ class SenhaCortePage(QWidget):
 		super().__init__(parent)
 		self.setObjectName("PaginaSenhaCorte")
 		self._itens: List[Dict] = []
+		# Diálogos criados sob demanda e reutilizados nas próximas aberturas
+		self._dlg_tratativas: Optional[TratativasDialog] = None
+		self._dlg_itens: Optional[ItensDialog] = None
 		self._build()
 
 	def _build(self) -> None:
@@ -596,11 +720,14 @@ class SenhaCortePage(QWidget):
 		self.btn_help.setToolTip("Ajuda sobre a seção Senha Corte")
 		self.btn_help.clicked.connect(self._on_help_clicked)
 
+		# Sombras ativas só enquanto a página está visível (ver showEvent/hideEvent)
+		self._sombras: List[QGraphicsDropShadowEffect] = []
 		try:
 			_title_shadow = QGraphicsDropShadowEffect(self)
 			_title_shadow.setBlurRadius(20)
 			_title_shadow.setOffset(0, 2)
 			lab_titulo.setGraphicsEffect(_title_shadow)
+			self._sombras.append(_title_shadow)
 		except Exception:
 			pass
 
@@ -616,6 +743,7 @@ class SenhaCortePage(QWidget):
 			shadow.setOffset(0, 4)
 			shadow.setColor(QColor(0, 0, 0, 60))
 			head_frame.setGraphicsEffect(shadow)
+			self._sombras.append(shadow)
 		except Exception:
 			pass
 		# Bordas arredondadas no cabeçalho e no container do título
@@ -671,8 +799,7 @@ class SenhaCortePage(QWidget):
 
 		self.ed_valor = QLineEdit()
 		# Aceita 123, 123.45, 123,45
-		regex = QRegularExpression(r"^\d{1,9}([\.,]\d{1,2})?$")
-		self.ed_valor.setValidator(QRegularExpressionValidator(regex, self))
+		self.ed_valor.setValidator(QRegularExpressionValidator(_VALOR_RE, self))
 		self.ed_valor.setPlaceholderText("Ex: 199,90")
 		form.addRow("&Valor:", self.ed_valor)
 
@@ -744,6 +871,17 @@ class SenhaCortePage(QWidget):
 		# Estilo base
 		self.setStyleSheet(self.styleSheet() + QSS_FORMULARIO_BASE)
 
+	def showEvent(self, event) -> None:  # type: ignore[override]
+		for sombra in self._sombras:
+			sombra.setEnabled(True)
+		super().showEvent(event)
+
+	def hideEvent(self, event) -> None:  # type: ignore[override]
+		# Fora da tela não há por que manter a renderização offscreen das sombras
+		for sombra in self._sombras:
+			sombra.setEnabled(False)
+		super().hideEvent(event)
+
 	def _verificar_ordem_existente(self) -> None:
 		"""Verifica se a ordem já existe e muda a cor do texto para vermelho se sim."""
 		txt = self.ed_ordem.text().strip()
@@ -766,11 +904,19 @@ class SenhaCortePage(QWidget):
 		self.lab_ordem_info.setText("")
 
 	def _abrir_tratativas(self) -> None:
-		dlg = TratativasDialog(self)
-		dlg.exec()
+		if self._dlg_tratativas is None:
+			# A construção já carrega a lista
+			self._dlg_tratativas = TratativasDialog(self)
+		else:
+			self._dlg_tratativas.reabrir()
+		self._dlg_tratativas.exec()
 
 	def _abrir_itens_dialogo(self) -> None:
-		dlg = ItensDialog(self, itens=self._itens)
+		if self._dlg_itens is None:
+			self._dlg_itens = ItensDialog(self, itens=self._itens)
+		else:
+			self._dlg_itens.set_itens(self._itens)
+		dlg = self._dlg_itens
 		if dlg.exec() == QDialog.Accepted:
 			self._itens = dlg.get_itens()
 			self._atualizar_resumo_itens()
@@ -798,48 +944,51 @@ class SenhaCortePage(QWidget):
 			),
 		)
 
-	def _validar(self) -> Optional[str]:
-		if not self.ed_ordem.text().strip():
-			return "Ordem é obrigatória."
-		try:
-			if int(self.ed_ordem.text()) < 10_000:
-				return "Ordem deve ser valida."
-		except Exception:
-			return "Ordem inválida."
-		if not self.ed_carga.text().strip():
-			return "Carga é obrigatória."
-		try:
-			if int(self.ed_carga.text()) < 1_000:
-				return "Carga deve ser valida."
-		except Exception:
-			return "Carga inválida."
+	def _validar(self) -> Tuple[Optional[str], Optional[Dict[str, int]]]:
+		"""Valida o formulário; retorna (erro, valores inteiros já convertidos)."""
+		# (chave, campo, mínimo, rótulo)
+		regras = (
+			("ordem", self.ed_ordem, 10_000, "Ordem"),
+			("carga", self.ed_carga, 1_000, "Carga"),
+		)
+		parsed: Dict[str, int] = {}
+		for chave, campo, minimo, rotulo in regras:
+			txt = campo.text().strip()
+			if not txt:
+				return f"{rotulo} é obrigatória.", None
+			try:
+				v = int(txt)
+			except ValueError:
+				return f"{rotulo} inválida.", None
+			if v < minimo:
+				return f"{rotulo} deve ser valida.", None
+			parsed[chave] = v
 		if not self.ed_valor.text().strip():
-			return "Valor é obrigatório."
+			return "Valor é obrigatório.", None
 		# Itens obrigatórios
 		if not self._itens:
-			return "Adicione pelo menos um item."
-		return None
+			return "Adicione pelo menos um item.", None
+		return None, parsed
 
 	def _parse_valor(self, s: str) -> float:
-		s = (s or "").strip()
+		s = (s or "").strip().translate(_TRANS_VALOR)
 		if not s:
 			return 0.0
-		s = s.replace(" ", "")
 		if "," in s and "." in s:
-			s = s.replace(".", "")
-			s = s.replace(",", ".")
-		elif "," in s:
-			s = s.replace(".", "")
+			# O último separador é o decimal; os demais são de milhar
+			sep = max(s.rfind("."), s.rfind(","))
+			s = s[:sep].replace(".", "").replace(",", "") + "." + s[sep + 1:]
+		else:
 			s = s.replace(",", ".")
 		try:
 			return float(s)
 		except Exception:
 			return 0.0
 
-	def _coletar_payload(self) -> Dict:
+	def _coletar_payload(self, parsed: Dict[str, int]) -> Dict:
 		payload = {
-			"ordem": int(self.ed_ordem.text()),
-			"carga": int(self.ed_carga.text()),
+			"ordem": parsed["ordem"],
+			"carga": parsed["carga"],
 			"valor": self._parse_valor(self.ed_valor.text()),
 			"data_ordem": self.ed_data.date().toString("yyyy-MM-dd"),
 			"tipo": self.cb_tipo.currentText(),
@@ -887,19 +1036,17 @@ class SenhaCortePage(QWidget):
 		self.ed_ordem.setFocus()
 
 	def _on_inserir(self) -> None:
-		erro = self._validar()
+		erro, parsed = self._validar()
 		if erro:
 			QMessageBox.warning(self, "Aviso", erro)
 			return
 		# Checa duplicidade de Ordem
-		try:
-			ordem_i = int(self.ed_ordem.text())
-		except Exception:
-			ordem_i = 0
+		ordem_i = parsed["ordem"]
 		if ordem_i >= 10000:
+			# Sem memo: a duplicidade que bloqueia a gravação vem sempre do banco
 			try:
 				existente = obter_senha_corte_por_ordem(ordem_i)
-			except Exception as e:
+			except Exception:
 				existente = None
 			if existente:
 				usuario = existente.get("usuario") or "(sem usuário)"
@@ -913,7 +1060,7 @@ class SenhaCortePage(QWidget):
 					f"Carga: {carga}\nData: {data}\nTratativa: {tipo}",
 				)
 				return
-		data = self._coletar_payload()
+		data = self._coletar_payload(parsed)
 		# Persistência no banco
 		try:
 			cab_id = salvar_senha_corte(
@@ -929,6 +1076,5 @@ class SenhaCortePage(QWidget):
 			QMessageBox.information(self, "Senha Corte", f"Registro salvo com sucesso (ID {cab_id}).")
 			self._limpar_formulario()
 		except Exception as e:
+			# Mantém os dados para o usuário corrigir e tentar novamente
 			QMessageBox.critical(self, "Erro", f"Falha ao salvar: {e}")
-		# Limpa o formulário após inserção
-		self._limpar_formulario()
@@ -13,22 +13,28 @@ Requisitos do usuário: apenas a interface para inserir os quatro campos solicit
 
 from __future__ import annotations
 
-from dataclasses import dataclass
-from typing import Optional, Dict
-from time import time
+from functools import lru_cache
+from typing import Callable, Optional, Dict
 import sys
+import threading
+import time
 from pathlib import Path
 
 try:
-	from PySide6.QtCore import Qt, QSize, QEasingCurve, QVariantAnimation, QAbstractAnimation
-	from PySide6.QtGui import QIntValidator, QIcon, QPalette, QColor, QPixmap, QGuiApplication
+	from PySide6.QtCore import (
+		Qt, QSize, QEasingCurve, QVariantAnimation, QAbstractAnimation, QTimer,
+		QObject, QRunnable, QThreadPool, Signal, QEvent, QPoint, QRect,
+	)
+	from PySide6.QtGui import (
+		QIcon, QColor, QPixmap, QGuiApplication, QStandardItemModel, QStandardItem, QPainter,
+	)
 	from PySide6.QtWidgets import (
 		QApplication,
 		QWidget,
 		QFormLayout,
+		QGridLayout,
 		QLineEdit,
 		QComboBox,
-		QTextEdit,
 		QPushButton,
 		QHBoxLayout,
 		QVBoxLayout,
@@ -41,14 +47,10 @@ try:
 		QScrollArea,
 		QButtonGroup,
 		QDialog,
-		QSpacerItem,
-		QGridLayout,
-		QGraphicsDropShadowEffect,
-		QTableWidget,
-		QTableWidgetItem,
-		QHeaderView,
-	QAbstractScrollArea,
-	QStyle,
+		QListView,
+		QAbstractItemView,
+		QStyledItemDelegate,
+		QStyle,
 	)
 except ImportError as exc:  # Falha clara caso dependência não esteja instalada
 	raise SystemExit(
@@ -59,81 +61,226 @@ except ImportError as exc:  # Falha clara caso dependência não esteja instalad
 from style import (
 	build_palette_claro,
 	build_palette_escuro,
-	QSS_HEADER_BLOQUEADO,
-	QSS_FORMULARIO_BASE,
 	QSS_CONSULTAS_PAGE,
 	QSS_SLIMBAR_BASE,
+	QSS_AUTH_DIALOG,
 	qss_tema_extra,
 	qss_focus_override,
 )
 
-# Lista global de setores centralizada em config
-from config import SETORES as SETORES_GLOBAIS
+# Importar config carrega o .env antes de database criar o engine
+import config  # noqa: F401
 
-# Import opcional da página de gráficos
+# database cria o engine ao ser importado: DATABASE_URL inválida ou driver ausente
+# falham aqui, antes de existir QApplication. A falha é guardada e executar()
+# a mostra no diálogo "Erro BD" em vez de um traceback.
+_erro_import_db: Optional[Exception] = None
 try:
+	from database import (
+		init_db,
+		autenticar_usuario,
+		criar_usuario,
+		alterar_senha,
+		obter_usuario_atual,
+		obter_tipo_usuario_atual,
+		listar_usuarios,
+		redefinir_senha_usuario,
+		excluir_usuario,
+	)
+	from sqlalchemy.exc import SQLAlchemyError
+except Exception as exc:  # pragma: no cover - depende do ambiente
+	_erro_import_db = exc
+
+# Páginas opcionais: cada módulo só é importado quando a página é construída.
+# Imports explícitos (e não importlib com strings) para o PyInstaller continuar
+# detectando os módulos no empacotamento.
+def _pagina_grafico():
 	from grafico import GraficoPage  # type: ignore
-	HAS_GRAFICO = True
-except Exception:
-	HAS_GRAFICO = False
+	return GraficoPage
 
-# Import opcional da página de consolidado
-try:
+
+def _pagina_consolidado():
 	from consolidado import ConsolidadoPage  # type: ignore
-	HAS_CONSOLIDADO = True
-except Exception:
-	HAS_CONSOLIDADO = False
+	return ConsolidadoPage
 
-# Import opcional da página de monitoramento
-try:
+
+def _pagina_monitoramento():
 	from monitoramento import MonitoramentoPage  # type: ignore
-	HAS_MONITORAMENTO = True
-except Exception:
-	HAS_MONITORAMENTO = False
+	return MonitoramentoPage
 
-# Import opcional da página de EPIs
-try:
+
+def _pagina_epis():
 	from epis import EpisPage  # type: ignore
-	HAS_EPIS = True
-except Exception:
-	HAS_EPIS = False
+	return EpisPage
 
-# Import opcional da página Senha Corte
-try:
+
+def _pagina_senha_corte():
 	from senha_corte import SenhaCortePage  # type: ignore
-	HAS_SENHA_CORTE = True
-except Exception:
-	HAS_SENHA_CORTE = False
+	return SenhaCortePage
 
-# Import opcional da página de almoxarifado
-try:
+
+def _pagina_almoxarifado():
 	from almoxarifado import AlmoxarifadoPage  # type: ignore
-	HAS_ALMOX = True
-except Exception:
-	HAS_ALMOX = False
+	return AlmoxarifadoPage
 
-# Import opcional da página de consultas externa
-try:
+
+def _pagina_consultas():
 	from consultas import ConsultasPage  # type: ignore
-	HAS_CONSULTAS_PAGE = True
-except Exception:
-	HAS_CONSULTAS_PAGE = False
+	return ConsultasPage
 
-# Import opcional da página de Registros (auditoria)
-try:
+
+def _pagina_registros():
 	from registros import RegistrosPage  # type: ignore
-	HAS_REGISTROS = True
-except Exception:
-	HAS_REGISTROS = False
+	return RegistrosPage
 
-# Import opcional da página Bloqueado (extraída)
-try:
+
+def _pagina_bloqueado():
 	from bloqueado import BloqueadoPage  # type: ignore
-	HAS_BLOQUEADO = True
-except Exception:
-	HAS_BLOQUEADO = False
+	return BloqueadoPage
+
+
+# objectNames aceitos para a página Bloqueado (nome atual e legado)
+_BLOQUEADO_OBJNAMES = frozenset({"PaginaBloqueado", "PaginaBloqueadoPage"})
+
+
+# QSS da página Consultas no tema escuro (o claro é QSS_CONSULTAS_PAGE)
+_QSS_CONSULTAS_ESCURO = """
+	#PaginaConsultas QLineEdit { padding:6px 8px; }
+	#TabelaConsultas { background:#403f3f; border:1px solid #b7d9ef; gridline-color:#bababa; color:#fff; alternate-background-color:#292929; }
+	#TabelaConsultas QHeaderView::section { background:qlineargradient(x1:0,y1:0,x2:0,y2:1, stop:0 #001d2e, stop:1 #001724); color:#ffffff; padding:4px 6px; border:1px solid #002336; font-weight:600; }
+	#StatusConsultaLabel { color:#666; padding:4px 2px; }
+"""
+
+
+# Roles da lista de usuários (Configurações)
+_ROLE_USERNAME = Qt.ItemDataRole.UserRole
+_ROLE_TIPO = Qt.ItemDataRole.UserRole + 1
+# Destaque de administradores, legível nos dois temas
+_COR_ITEM_ADMIN = QColor(255, 206, 84, 70)
+
+
+class _UsuarioDelegate(QStyledItemDelegate):
+	"""Pinta o destaque dos administradores (o QSS de ::item ignora o BackgroundRole)."""
+
+	def paint(self, painter, option, index) -> None:
+		if str(index.data(_ROLE_TIPO) or "").upper() == "ADMINISTRADOR":
+			painter.save()
+			painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+			painter.setPen(Qt.PenStyle.NoPen)
+			painter.setBrush(_COR_ITEM_ADMIN)
+			painter.drawRoundedRect(option.rect.adjusted(1, 1, -1, -1), 10, 10)
+			painter.restore()
+		super().paint(painter, option, index)
+
+
+class _DbSinais(QObject):
+	"""Sinais das operações de banco em segundo plano (entregues na thread da GUI)."""
+
+	concluido = Signal(object)  # (ok, resultado | exceção)
+
+
+class _DbTask(QRunnable):
+	"""Executa `func(**kwargs)` fora da thread da GUI e emite (ok, resultado | exceção)."""
+
+	def __init__(self, func: Callable, **kwargs) -> None:
+		super().__init__()
+		self.sinais = _DbSinais()
+		self._func = func
+		self._kwargs = kwargs
+
+	def run(self) -> None:
+		try:
+			self.sinais.concluido.emit((True, self._func(**self._kwargs)))
+		except Exception as e:
+			self.sinais.concluido.emit((False, e))
+
+
+@lru_cache(maxsize=8)
+def _pixmap_sombra(raio: int, blur: int, rgba: tuple) -> QPixmap:
+	"""Sombra nine-slice renderizada uma única vez: cantos de (raio + blur) px e miolo de 1 px.
+
+	O degradê é aproximado por retângulos arredondados concêntricos de baixa opacidade,
+	equivalente visual do QGraphicsDropShadowEffect sem o blur a cada repaint.
+	"""
+	canto = raio + blur
+	lado = 2 * canto + 1
+	pix = QPixmap(lado, lado)
+	pix.fill(Qt.GlobalColor.transparent)
+	r, g, b, alfa = rgba
+	cor = QColor(r, g, b, max(1, round(alfa / blur)))
+	p = QPainter(pix)
+	p.setRenderHint(QPainter.RenderHint.Antialiasing)
+	p.setPen(Qt.PenStyle.NoPen)
+	p.setBrush(cor)
+	for i in range(blur):
+		p.drawRoundedRect(i, i, lado - 2 * i, lado - 2 * i, canto - i, canto - i)
+	p.end()
+	return pix
+
+
+def _desenhar_sombra(p: QPainter, alvo: QRect, pix: QPixmap, canto: int) -> None:
+	"""Desenha `pix` (nine-slice) esticado sobre `alvo`."""
+	x, y, w, h = alvo.x(), alvo.y(), alvo.width(), alvo.height()
+	if w < 2 * canto or h < 2 * canto:
+		return
+	c, meio_w, meio_h = canto, w - 2 * canto, h - 2 * canto
+	fatias = (
+		# (origem x, origem y, larg., alt.) -> (destino x, destino y, larg., alt.)
+		((0, 0, c, c), (x, y, c, c)),
+		((c + 1, 0, c, c), (x + w - c, y, c, c)),
+		((0, c + 1, c, c), (x, y + h - c, c, c)),
+		((c + 1, c + 1, c, c), (x + w - c, y + h - c, c, c)),
+		((c, 0, 1, c), (x + c, y, meio_w, c)),
+		((c, c + 1, 1, c), (x + c, y + h - c, meio_w, c)),
+		((0, c, c, 1), (x, y + c, c, meio_h)),
+		((c + 1, c, c, 1), (x + w - c, y + c, c, meio_h)),
+		((c, c, 1, 1), (x + c, y + c, meio_w, meio_h)),
+	)
+	for origem, destino in fatias:
+		p.drawPixmap(QRect(*destino), pix, QRect(*origem))
+
+
+class _FrameComSombras(QFrame):
+	"""QFrame que pinta sombras pré-renderizadas sob cartões filhos.
+
+	Substitui QGraphicsDropShadowEffect, que rasteriza e desfoca o widget a cada repaint.
+	"""
+
+	def __init__(self, parent: Optional[QWidget] = None) -> None:
+		super().__init__(parent)
+		self._sombras: list = []  # (cartão, raio, blur, deslocamento y, rgba)
+
+	def adicionar_sombra(self, card: QWidget, *, raio: int, blur: int, dy: int, cor: QColor) -> None:
+		card._sombra_ativa = True
+		self._sombras.append((card, raio, blur, dy, (cor.red(), cor.green(), cor.blue(), cor.alpha())))
+		card.installEventFilter(self)
+
+	def definir_sombra_ativa(self, card: QWidget, ativa: bool) -> None:
+		if getattr(card, "_sombra_ativa", None) != ativa:
+			card._sombra_ativa = ativa
+			self.update()
+
+	def eventFilter(self, obj, event) -> bool:  # noqa: N802
+		# A sombra fica fora do retângulo do cartão: repinta quando ele muda
+		if event.type() in (QEvent.Type.Move, QEvent.Type.Resize, QEvent.Type.Show, QEvent.Type.Hide):
+			self.update()
+		return super().eventFilter(obj, event)
+
+	def paintEvent(self, event) -> None:  # noqa: N802
+		super().paintEvent(event)
+		if not self._sombras:
+			return
+		p = QPainter(self)
+		for card, raio, blur, dy, rgba in self._sombras:
+			if not card.isVisible() or not card._sombra_ativa:
+				continue
+			alvo = QRect(card.mapTo(self, QPoint(0, 0)), card.size()).adjusted(-blur, -blur + dy, blur, blur + dy)
+			_desenhar_sombra(p, alvo, _pixmap_sombra(raio, blur, rgba), raio + blur)
+		p.end()
+
 
 # Utilitário para localizar arquivos de recursos (assets) tanto em desenvolvimento quanto empacotado (PyInstaller)
+@lru_cache(maxsize=32)
 def _resource_path(rel_path: str) -> str:
 	base = getattr(sys, "_MEIPASS", None)
 	if base:
@@ -141,11 +288,9 @@ def _resource_path(rel_path: str) -> str:
 	return str(Path(__file__).resolve().parent / rel_path)
 
 
+@lru_cache(maxsize=1)
 def _get_app_icon():
-	try:
-		from PySide6.QtGui import QIcon
-	except Exception:
-		return None
+	# Resolvido uma vez por processo (QIcon é compartilhado implicitamente)
 	for candidate in ("assets/app_icon.ico", "assets/app_icon.png", "assets/app_icon.svg"):
 		p = Path(_resource_path(candidate))
 		if p.exists():
@@ -230,22 +375,21 @@ class ExportDialog(QDialog):
 
 	def _confirmar(self) -> None:
 		# Se ambas datas estiverem ativas, garantir ordem válida
-		if getattr(self, "chk_data_ini", None) and getattr(self, "chk_data_fim", None):
-			if self.chk_data_ini.isChecked() and self.chk_data_fim.isChecked():
-				if self.ed_data_ini.date() > self.ed_data_fim.date():
-					QMessageBox.warning(self, "Aviso", "Data inicial não pode ser maior que a final.")
-					return
+		if self.chk_data_ini.isChecked() and self.chk_data_fim.isChecked():
+			if self.ed_data_ini.date() > self.ed_data_fim.date():
+				QMessageBox.warning(self, "Aviso", "Data inicial não pode ser maior que a final.")
+				return
 		self.accept()
 
 	def get_params(self) -> dict:
 		fmt_date = "yyyy-MM-dd"
 		data_ini = None
 		data_fim = None
-		if getattr(self, "chk_data_ini", None) and self.chk_data_ini.isChecked():
+		if self.chk_data_ini.isChecked():
 			data_ini = self.ed_data_ini.date().toString(fmt_date)
-		if getattr(self, "chk_data_fim", None) and self.chk_data_fim.isChecked():
+		if self.chk_data_fim.isChecked():
 			data_fim = self.ed_data_fim.date().toString(fmt_date)
-		mot = self.cb_motivo.currentText() if hasattr(self, "cb_motivo") else None
+		mot = self.cb_motivo.currentText()
 		# "Outros" = sem filtro (todos)
 		if mot == "Outros":
 			mot = None
@@ -266,25 +410,27 @@ class MainWindow(QMainWindow):
 	A página 'Bloqueado' usa o formulário existente. Outras páginas são placeholders.
 	"""
 
-	SECOES: list = [
-		"Consultas",
-		"Consolidado",
-		"Bloqueado",
-		"Entrada",
-		"Saida",
-		"Senha Falta",
-		"Senha Corte",
-		"balanceamento",
-		"Cadastro",
-		"Monitoramento",
-		"Almoxarifado",
-		"EPIs",
-		"Sindicância",
-		"Checklist",
-		"Grafico",
-		"Registros",
-		"Configurações",
-	]
+	# (nome, ícone, carregador da classe da página | None, texto do placeholder se o módulo faltar)
+	# Seções sem carregador viram placeholder; "Configurações" é montada pela própria janela.
+	SECOES: tuple = (
+		("Consultas", "📊", _pagina_consultas, "Consultas (módulo ausente)"),
+		("Consolidado", "📟", _pagina_consolidado, "Consolidado (módulo ausente)"),
+		("Bloqueado", "🔒", _pagina_bloqueado, "Bloqueado (módulo ausente)"),
+		("Entrada", "📥", None, None),
+		("Saida", "📤", None, None),
+		("Senha Falta", "🔑", None, None),
+		("Senha Corte", "🛡️", _pagina_senha_corte, "Senha Corte (módulo ausente)"),
+		("balanceamento", "⚖️", None, None),
+		("Cadastro", "👤", None, None),
+		("Monitoramento", "📋", _pagina_monitoramento, "Monitoramento (módulo ausente)"),
+		("Almoxarifado", "🏢", _pagina_almoxarifado, "Almoxarifado (módulo ausente)"),
+		("EPIs", "🦺", _pagina_epis, "EPIs (módulo ausente)"),
+		("Sindicância", "🕵️", None, None),
+		("Checklist", "☑️", None, None),
+		("Grafico", "📈", _pagina_grafico, "Grafico (QtCharts não disponível)"),
+		("Registros", "🗂️", _pagina_registros, "Registros (módulo ausente)"),
+		("Configurações", "⚙️", None, None),
+	)
 
 	def __init__(self) -> None:
 		super().__init__()
@@ -293,32 +439,17 @@ class MainWindow(QMainWindow):
 		self.setMinimumSize(960, 920)
 		self._botoes: Dict[str, QPushButton] = {}
 		self._stack = QStackedWidget()
+		# Seção -> página já construída (adicionada ao _stack sob demanda)
+		self._paginas_ref: Dict[str, QWidget] = {}
 		self._button_group = QButtonGroup(self)
 		self._button_group.setExclusive(True)
-		# Cache simples (item -> (timestamp, lista de registros)) para evitar consultas repetidas
-		self._consulta_cache: dict[int, tuple[float, list[dict]]] = {}
-		self._consulta_cache_ttl = 120.0  # segundos
-		self._consulta_cache_max = 50
 		self._ultimos_resultados_consulta: list[dict] = []  # cache da última consulta para exportação
-		self._icons_map: dict = {
-			"Consultas": "📊",
-			"Consolidado": "📟",
-			"Bloqueado": "🔒",
-			"Entrada": "📥",
-			"Saida": "📤",
-			"Senha Falta": "🔑",
-			"Senha Corte": "🛡️",
-			"balanceamento": "⚖️",
-			"Cadastro": "👤",
-			"Monitoramento": "📋",
-			"Almoxarifado": "🏢",
-			"EPIs": "🦺",
-			"Sindicância": "🕵️",
-			"Checklist": "☑️",
-			"Grafico": "📈",
-			"Registros": "🗂️",
-			"Configurações": "⚙️",
-		}
+		# Operações de banco em andamento (mantém referência até o retorno)
+		self._db_tasks: set = set()
+		# Carga da lista de usuários (Configurações) em andamento
+		self._carregando_usuarios = False
+		# QSS global composto por tema (modo -> stylesheet)
+		self._qss_cache: Dict[str, str] = {}
 		self._nav_filter_cache: str = ""
 		self._slimbar_width_expandido = 248
 		self._slimbar_width_colapsado = 88
@@ -327,22 +458,20 @@ class MainWindow(QMainWindow):
 		self.APP_SUBTITLE = "Gestão Integrada"
 		self.APP_VERSION = "v2.1.3"
 		# Captura usuário logado para exibir no footer
-		try:
-			from database import obter_usuario_atual
-			self.CURRENT_USER = obter_usuario_atual() or "USUARIO"  # manter caso correto para lógica
-			self.CURRENT_USER_DISPLAY = self.CURRENT_USER.upper()  # apenas para exibição
-		except Exception:
-			self.CURRENT_USER = "USUARIO"
-			self.CURRENT_USER_DISPLAY = self.CURRENT_USER
+		self.CURRENT_USER = obter_usuario_atual() or "USUARIO"  # manter caso correto para lógica
+		self.CURRENT_USER_DISPLAY = self.CURRENT_USER.upper()  # apenas para exibição
 		self._montar_ui()
-		self._aplicar_estilo_slimbar()
+		# O QSS do tema já inclui QSS_SLIMBAR_BASE: aplicar só a slimbar antes
+		# dele faria o Qt interpretar o stylesheet da janela duas vezes
+		self._stylesheet_base = self.styleSheet()
 		# Aplica tema CLARO imediatamente na inicialização da janela principal
+		# (ainda não há páginas: as criadas depois recebem o tema em _on_navegar)
 		try:
-			self._ativar_tema_claro()
-			if hasattr(self, "btn_tema_claro"):
-				self.btn_tema_claro.setChecked(True)
+			QApplication.instance().setPalette(_palette_claro())
+			self._atualizar_estilos_tema("claro")
+			self._tema_atual = "claro"
 		except Exception:
-			pass
+			self._aplicar_estilo_slimbar()
 		self._selecionar_secao_inicial("Consultas")
 
 	def _montar_ui(self) -> None:
@@ -351,7 +480,7 @@ class MainWindow(QMainWindow):
 		layout_root.setContentsMargins(0, 0, 0, 0)
 
 		# Slimbar
-		self.slimbar = QFrame()
+		self.slimbar = _FrameComSombras()
 		self.slimbar.setObjectName("Slimbar")
 		self._slimbar_colapsado = False
 		self.slimbar.setSizePolicy(QSizePolicy.Policy.Fixed, QSizePolicy.Policy.Expanding)
@@ -414,17 +543,26 @@ class MainWindow(QMainWindow):
 
 		# Botões de navegação
 		self._texto_botoes: Dict[str, str] = {}
-		for nome in self.SECOES:
-			rotulo = f"{self._icons_map.get(nome, '')}  {nome}".strip()
+		# Rótulos por modo da Slimbar, calculados uma única vez
+		self._labels_colapsado: Dict[str, str] = {}
+		self._fabricas_pagina: Dict[str, tuple] = {}
+		for nome, icone, carregar, fallback in self.SECOES:
+			rotulo = f"{icone}  {nome}".strip()
 			btn = QPushButton(rotulo)
 			btn.setCheckable(True)
 			btn.setCursor(Qt.CursorShape.PointingHandCursor)
 			btn.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Fixed)
-			btn.clicked.connect(lambda _=False, n=nome: self._on_navegar(n))
+			btn.setProperty("secao", nome)
 			self._botoes[nome] = btn
 			self._texto_botoes[nome] = rotulo
+			self._labels_colapsado[nome] = icone
+			self._fabricas_pagina[nome] = (carregar, fallback)
 			self._button_group.addButton(btn)
 			lay_nav_content.addWidget(btn)
+		self._labels_expandido: Dict[str, str] = dict(self._texto_botoes)
+
+		# Um único slot para todos os botões: a seção vem da property "secao"
+		self._button_group.buttonClicked.connect(self._on_nav_clicked)
 
 		lay_nav_content.addStretch(1)
 		nav_scroll.setWidget(nav_content)
@@ -451,80 +589,39 @@ class MainWindow(QMainWindow):
 			self._footer_refs["card"] = footer_card
 		lay_slim.addWidget(footer_card)
 
-		# Sombras sutis para destaque visual
+		# Sombras sutis para destaque visual (pré-renderizadas, pintadas pela Slimbar)
 		for card in (header_card, nav_card, footer_card):
-			try:
-				efeito = QGraphicsDropShadowEffect(card)
-				efeito.setBlurRadius(26 if card is header_card else 20)
-				efeito.setOffset(0, 6)
-				efeito.setColor(QColor(6, 25, 56, 38))
-				card.setGraphicsEffect(efeito)
-				setattr(card, "_shadow_effect", efeito)
-			except Exception:
-				pass
+			self.slimbar.adicionar_sombra(
+				card, raio=22, blur=13 if card is header_card else 10, dy=6, cor=QColor(6, 25, 56, 38)
+			)
 
 		self._nav_scroll = nav_scroll
 		self._slim_nav_refs = {"label": nav_label, "search": self.ed_nav_busca, "card": nav_card}
 		self._filtrar_botoes_navegacao("")
 		self._atualizar_toggle_botao(collapsed=False)
 
-		# Páginas
-		for nome in self.SECOES:
-			if nome == "Bloqueado":
-				if HAS_BLOQUEADO:
-					pagina = BloqueadoPage()
-				else:
-					pagina = self._criar_placeholder("Bloqueado (módulo ausente)")
-			elif nome == "Consultas":
-				if HAS_CONSULTAS_PAGE:
-					pagina = ConsultasPage()
-				else:
-					pagina = self._criar_placeholder("Consultas (módulo ausente)")
-			elif nome == "Consolidado":
-				if HAS_CONSOLIDADO:
-					pagina = ConsolidadoPage()
-				else:
-					pagina = self._criar_placeholder("Consolidado (módulo ausente)")
-			elif nome == "Grafico":
-				if HAS_GRAFICO:
-					pagina = GraficoPage()
-				else:
-					pagina = self._criar_placeholder("Grafico (QtCharts não disponível)")
-			elif nome == "Configurações":
-				pagina = self._criar_configuracoes()
-			elif nome == "Monitoramento":
-				if HAS_MONITORAMENTO:
-					pagina = MonitoramentoPage()
-				else:
-					pagina = self._criar_placeholder("Monitoramento (módulo ausente)")
-			elif nome == "Almoxarifado":
-				if HAS_ALMOX:
-					pagina = AlmoxarifadoPage()
-				else:
-					pagina = self._criar_placeholder("Almoxarifado (módulo ausente)")
-			elif nome == "EPIs":
-				if HAS_EPIS:
-					pagina = EpisPage()
-				else:
-					pagina = self._criar_placeholder("EPIs (módulo ausente)")
-			elif nome == "Senha Corte":
-				if HAS_SENHA_CORTE:
-					pagina = SenhaCortePage()
-				else:
-					pagina = self._criar_placeholder("Senha Corte (módulo ausente)")
-			elif nome == "Registros":
-				if HAS_REGISTROS:
-					pagina = RegistrosPage()
-				else:
-					pagina = self._criar_placeholder("Registros (módulo ausente)")
-			else:
-				pagina = self._criar_placeholder(nome)
-			self._stack.addWidget(pagina)
-
+		# Páginas são criadas sob demanda na primeira navegação (ver _on_navegar)
 		layout_root.addWidget(self.slimbar)
 		layout_root.addWidget(self._stack, 1)
 		self.setCentralWidget(container)
 
+	def _construir_pagina(self, nome: str) -> QWidget:
+		"""Cria a página da seção `nome` (módulos opcionais são importados apenas aqui)."""
+		if nome == "Configurações":
+			return self._criar_configuracoes()
+		carregar, fallback = self._fabricas_pagina.get(nome, (None, None))
+		if carregar is None:
+			return self._criar_placeholder(nome)
+		return self._criar_pagina_opcional(carregar, fallback)
+
+	def _criar_pagina_opcional(self, carregar: Callable[[], type], fallback: str) -> QWidget:
+		"""Importa a classe da página sob demanda e a instancia; usa placeholder se o módulo faltar."""
+		try:
+			cls = carregar()
+		except Exception:
+			return self._criar_placeholder(fallback)
+		return cls()
+
 	def _criar_placeholder(self, nome: str) -> QWidget:
 		w = QWidget()
 		lay = QVBoxLayout(w)
@@ -625,28 +722,29 @@ class MainWindow(QMainWindow):
 		self._slimbar_colapsado = collapsed
 		destino = self._slimbar_width_colapsado if collapsed else self._slimbar_width_expandido
 		self._animar_largura_slimbar(destino)
-		self._atualizar_toggle_botao(collapsed)
 
-		self._atualizar_header_slimbar(collapsed)
-		self._atualizar_nav_slimbar(collapsed)
-		self._atualizar_footer_slimbar(collapsed)
-		self._update_slimbar_labels()
-		if not collapsed:
-			# Reaplica filtro ao expandir para restaurar estado visual
-			self._filtrar_botoes_navegacao(self._nav_filter_cache)
+		# Agrupa as mudanças de visibilidade/texto/estilo em um único repaint
+		self.slimbar.setUpdatesEnabled(False)
+		try:
+			self._atualizar_toggle_botao(collapsed)
+			self._atualizar_header_slimbar(collapsed)
+			self._atualizar_nav_slimbar(collapsed)
+			self._atualizar_footer_slimbar(collapsed)
+			self._update_slimbar_labels()
+			if not collapsed:
+				# Reaplica filtro ao expandir para restaurar estado visual
+				self._filtrar_botoes_navegacao(self._nav_filter_cache)
+		finally:
+			self.slimbar.setUpdatesEnabled(True)
 
 	def _update_slimbar_labels(self) -> None:
 		"""Atualiza o texto dos botões da Slimbar conforme estado (colapsado/expandido)."""
+		colapsado = self._slimbar_colapsado
+		rotulos = self._labels_colapsado if colapsado else self._labels_expandido
 		for nome, btn in self._botoes.items():
-			icon = self._icons_map.get(nome, "")
-			if self._slimbar_colapsado:
-				btn.setText(icon)
-				btn.setToolTip(nome)
-				btn.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Fixed)
-			else:
-				btn.setText(self._texto_botoes.get(nome, f"{icon}  {nome}"))
-				btn.setToolTip("")
-			btn.setProperty("collapsed", self._slimbar_colapsado)
+			btn.setText(rotulos[nome])
+			btn.setToolTip(nome if colapsado else "")
+			btn.setProperty("collapsed", colapsado)
 			self._refresh_widget_style(btn)
 
 	def _atualizar_header_slimbar(self, collapsed: bool) -> None:
@@ -715,23 +813,7 @@ class MainWindow(QMainWindow):
 	def _set_card_shadow_enabled(self, card: Optional[QWidget], enabled: bool) -> None:
 		if card is None:
 			return
-		efeito = getattr(card, "_shadow_effect", None)
-		if efeito is None or efeito.parent() is None:
-			if not enabled:
-				return
-			try:
-				nome = card.objectName() if hasattr(card, "objectName") else ""
-				efeito = QGraphicsDropShadowEffect(card)
-				efeito.setBlurRadius(26 if nome == "SlimHeaderCard" else 20)
-				efeito.setOffset(0, 6)
-				efeito.setColor(QColor(6, 25, 56, 38))
-				card.setGraphicsEffect(efeito)
-				setattr(card, "_shadow_effect", efeito)
-			except Exception:
-				return
-		if efeito is not card.graphicsEffect():
-			card.setGraphicsEffect(efeito)
-		efeito.setEnabled(enabled)
+		self.slimbar.definir_sombra_ativa(card, enabled)
 
 	def _set_card_visual_state(self, card: Optional[QWidget], collapsed: bool) -> None:
 		if card is None:
@@ -795,7 +877,7 @@ class MainWindow(QMainWindow):
 		self._refresh_widget_style(btn)
 
 	def _criar_configuracoes(self) -> QWidget:
-		w = QWidget()
+		w = _FrameComSombras()
 		w.setObjectName("PaginaConfiguracoes")
 		lay = QVBoxLayout(w)
 		lay.setContentsMargins(36, 28, 36, 36)
@@ -857,19 +939,14 @@ class MainWindow(QMainWindow):
 		self._grupo_tema.addButton(self.btn_tema_claro)
 		self._grupo_tema.addButton(self.btn_tema_escuro)
 
-		self.btn_tema_claro.clicked.connect(lambda: self._aplicar_tema_global("claro"))
-		self.btn_tema_escuro.clicked.connect(lambda: self._aplicar_tema_global("escuro"))
+		# Mesmo esquema da navegação: um slot para o grupo, o modo vem da property "modo"
+		self.btn_tema_claro.setProperty("modo", "claro")
+		self.btn_tema_escuro.setProperty("modo", "escuro")
+		self._grupo_tema.buttonClicked.connect(self._on_tema_clicked)
 
 		hero_layout.addWidget(toggle_wrap, 0, Qt.AlignmentFlag.AlignTop)
 
-		try:
-			hero_shadow = QGraphicsDropShadowEffect(self)
-			hero_shadow.setBlurRadius(30)
-			hero_shadow.setOffset(0, 8)
-			hero_shadow.setColor(QColor(0, 0, 0, 55))
-			hero.setGraphicsEffect(hero_shadow)
-		except Exception:
-			pass
+		w.adicionar_sombra(hero, raio=20, blur=15, dy=8, cor=QColor(0, 0, 0, 55))
 
 		lay.addWidget(hero)
 
@@ -910,21 +987,16 @@ class MainWindow(QMainWindow):
 		btn_row = QHBoxLayout()
 		btn_row.setSpacing(12)
 		btn_row.addStretch(1)
-		btn_salvar_senha = QPushButton("Salvar nova senha")
-		btn_salvar_senha.setObjectName("ConfigPrimaryButton")
-		btn_salvar_senha.setCursor(Qt.CursorShape.PointingHandCursor)
-		btn_salvar_senha.clicked.connect(self._alterar_senha)
-		btn_row.addWidget(btn_salvar_senha)
+		self.btn_salvar_senha = QPushButton("Salvar nova senha")
+		self.btn_salvar_senha.setObjectName("ConfigPrimaryButton")
+		self.btn_salvar_senha.setCursor(Qt.CursorShape.PointingHandCursor)
+		self.btn_salvar_senha.clicked.connect(self._alterar_senha)
+		btn_row.addWidget(self.btn_salvar_senha)
 		senha_layout.addLayout(btn_row)
 
 		lay.addWidget(senha_card)
 
-		try:
-			from database import obter_tipo_usuario_atual
-			is_admin = obter_tipo_usuario_atual() == "ADMINISTRADOR"
-		except Exception:
-			is_admin = False
-		if is_admin:
+		if obter_tipo_usuario_atual() == "ADMINISTRADOR":
 			lay.addWidget(self._criar_secao_admin())
 
 		lay.addStretch(1)
@@ -954,18 +1026,22 @@ class MainWindow(QMainWindow):
 		desc.setObjectName("ConfigCardSubtitle")
 		lv.addWidget(desc)
 
-		self.scroll_users = QScrollArea()
-		self.scroll_users.setObjectName("ConfigListScroll")
-		self.scroll_users.setWidgetResizable(True)
-		self.scroll_users.setFrameShape(QFrame.Shape.NoFrame)
-		self.scroll_users.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
-		self.scroll_users.setMinimumHeight(180)
-		cont = QWidget()
-		self.layout_users = QVBoxLayout(cont)
-		self.layout_users.setSpacing(6)
-		self.layout_users.setContentsMargins(0, 0, 0, 0)
-		self.scroll_users.setWidget(cont)
-		lv.addWidget(self.scroll_users)
+		# Model/view: recarregar a lista só troca as linhas do modelo (sem criar widgets por usuário)
+		self._users_model = QStandardItemModel(self)
+		self.lst_users = QListView()
+		self.lst_users.setObjectName("ConfigUserList")
+		self.lst_users.setModel(self._users_model)
+		self.lst_users.setItemDelegate(_UsuarioDelegate(self.lst_users))
+		self.lst_users.setEditTriggers(QAbstractItemView.EditTrigger.NoEditTriggers)
+		self.lst_users.setSelectionMode(QAbstractItemView.SelectionMode.SingleSelection)
+		self.lst_users.setUniformItemSizes(True)
+		self.lst_users.setSpacing(3)
+		self.lst_users.setFrameShape(QFrame.Shape.NoFrame)
+		self.lst_users.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
+		self.lst_users.setCursor(Qt.CursorShape.PointingHandCursor)
+		self.lst_users.setMinimumHeight(180)
+		self.lst_users.clicked.connect(self._on_usuario_clicado)
+		lv.addWidget(self.lst_users)
 
 		linha_sel = QHBoxLayout()
 		linha_sel.setSpacing(10)
@@ -1003,45 +1079,59 @@ class MainWindow(QMainWindow):
 		self._usuario_sel_tipo = ""
 		self._reset_admin_selection()
 
-		self._carregar_usuarios_admin()
+		# Consulta ao banco fica fora da montagem: a página pinta antes e a lista chega em seguida
+		QTimer.singleShot(0, self._carregar_usuarios_admin)
 		return wrap
 
+	def _executar_db(self, func: Callable, ao_concluir: Callable[[tuple], None], **kwargs) -> None:
+		"""Roda `func(**kwargs)` no QThreadPool; `ao_concluir` recebe (ok, resultado | exceção)."""
+		task = _DbTask(func, **kwargs)
+		self._db_tasks.add(task)
+		task.sinais.concluido.connect(lambda _r, t=task: self._db_tasks.discard(t))
+		task.sinais.concluido.connect(ao_concluir)
+		QThreadPool.globalInstance().start(task)
+
 	def _carregar_usuarios_admin(self) -> None:
-		# Limpa lista
-		while self.layout_users.count():
-			item = self.layout_users.takeAt(0)
-			w = item.widget()
-			if w:
-				w.deleteLater()
-		try:
-			from database import listar_usuarios
-			usuarios = listar_usuarios()
-		except Exception as exc:  # pragma: no cover
-			lab_err = QLabel(f"Erro ao carregar usuários: {exc}")
-			self.layout_users.addWidget(lab_err)
+		if self._carregando_usuarios:
+			return
+		self._carregando_usuarios = True
+		self.btn_refresh_users.setEnabled(False)
+		self._executar_db(listar_usuarios, self._on_usuarios_carregados)
+
+	def _on_usuarios_carregados(self, resultado: tuple) -> None:
+		self._carregando_usuarios = False
+		self.btn_refresh_users.setEnabled(True)
+		ok, usuarios = resultado
+		self._users_model.clear()
+		if not ok:
+			self._users_model.appendRow(self._item_lista_aviso(f"Erro ao carregar usuários: {usuarios}"))
 			self._reset_admin_selection()
 			return
 		if not usuarios:
-			lab_vazio = QLabel("Nenhum usuário encontrado.")
-			lab_vazio.setObjectName("ConfigEmptyLabel")
-			lab_vazio.setAlignment(Qt.AlignmentFlag.AlignCenter)
-			self.layout_users.addWidget(lab_vazio)
+			self._users_model.appendRow(self._item_lista_aviso("Nenhum usuário encontrado."))
 			self._reset_admin_selection()
 			return
+		itens = []
 		for u in usuarios:
-			nome_display = f"{u['username']}  ·  {u['tipo'].title()}"
-			btn = QPushButton(nome_display)
-			eh_admin = u["tipo"].upper() == "ADMINISTRADOR"
-			btn.setObjectName("ConfigListButtonAdmin" if eh_admin else "ConfigListButton")
-			btn.setCheckable(False)
-			btn.setCursor(Qt.CursorShape.PointingHandCursor)
-			btn.clicked.connect(
-				lambda _=False, nome=u["username"], tipo=u["tipo"]: self._selecionar_usuario_admin(nome, tipo)
-			)
-			self.layout_users.addWidget(btn)
-		self.layout_users.addStretch(1)
+			item = QStandardItem(f"{u['username']}  ·  {u['tipo'].title()}")
+			item.setData(u["username"], _ROLE_USERNAME)
+			item.setData(u["tipo"], _ROLE_TIPO)
+			itens.append(item)
+		self._users_model.invisibleRootItem().appendRows(itens)
 		self._reset_admin_selection()
 
+	@staticmethod
+	def _item_lista_aviso(texto: str) -> QStandardItem:
+		item = QStandardItem(texto)
+		item.setFlags(Qt.ItemFlag.NoItemFlags)
+		item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
+		return item
+
+	def _on_usuario_clicado(self, index) -> None:
+		nome = index.data(_ROLE_USERNAME)
+		if nome:
+			self._selecionar_usuario_admin(nome, index.data(_ROLE_TIPO))
+
 	def _selecionar_usuario_admin(self, username: str, tipo: str) -> None:
 		self._usuario_sel_tipo = tipo.upper()
 		if self._usuario_sel_tipo == "ADMINISTRADOR":
@@ -1087,16 +1177,18 @@ class MainWindow(QMainWindow):
 		if not nova:
 			QMessageBox.warning(self, "Aviso", "Informe nova senha.")
 			return
-		try:
-			from database import redefinir_senha_usuario
-			ok = redefinir_senha_usuario(username=user_alvo, nova_senha=nova)
-		except ValueError as exc:
-			QMessageBox.critical(self, "Erro", str(exc))
-			return
-		except Exception as exc:  # pragma: no cover
-			QMessageBox.critical(self, "Erro", f"Falha: {exc}")
-			return
+		self._bloquear_acoes_usuario()
+		self._executar_db(
+			redefinir_senha_usuario, self._on_senha_redefinida, username=user_alvo, nova_senha=nova
+		)
+
+	def _on_senha_redefinida(self, resultado: tuple) -> None:
+		self._configurar_acoes_usuario(self._usuario_sel_tipo or "NONE")
+		ok, valor = resultado
 		if not ok:
+			self._mostrar_erro_db(valor)
+			return
+		if not valor:
 			QMessageBox.warning(self, "Aviso", "Usuário não encontrado.")
 			return
 		QMessageBox.information(self, "Sucesso", "Senha redefinida.")
@@ -1116,101 +1208,111 @@ class MainWindow(QMainWindow):
 		resp = QMessageBox.question(self, "Confirmar", f"Excluir usuário '{user_alvo}'?", QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No, QMessageBox.StandardButton.No)
 		if resp != QMessageBox.StandardButton.Yes:
 			return
-		try:
-			from database import excluir_usuario
-			ok = excluir_usuario(username=user_alvo)
-		except ValueError as exc:
-			QMessageBox.critical(self, "Erro", str(exc))
-			return
-		except Exception as exc:  # pragma: no cover
-			QMessageBox.critical(self, "Erro", f"Falha: {exc}")
-			return
+		self._bloquear_acoes_usuario()
+		self._executar_db(excluir_usuario, self._on_usuario_excluido, username=user_alvo)
+
+	def _on_usuario_excluido(self, resultado: tuple) -> None:
+		self._configurar_acoes_usuario(self._usuario_sel_tipo or "NONE")
+		ok, valor = resultado
 		if not ok:
+			self._mostrar_erro_db(valor)
+			return
+		if not valor:
 			QMessageBox.warning(self, "Aviso", "Usuário não encontrado ou não pode ser excluído.")
 			return
 		QMessageBox.information(self, "Sucesso", "Usuário excluído.")
 		self.ed_usuario_sel.clear()
 		self._carregar_usuarios_admin()
 
+	def _bloquear_acoes_usuario(self) -> None:
+		"""Desabilita as ações do painel enquanto a operação roda em segundo plano."""
+		self.btn_redef_user.setEnabled(False)
+		self.btn_excluir_user.setEnabled(False)
+
+	def _mostrar_erro_db(self, exc: Exception) -> None:
+		if isinstance(exc, ValueError):
+			QMessageBox.critical(self, "Erro", str(exc))
+		else:
+			QMessageBox.critical(self, "Erro", f"Falha: {exc}")
+
 	def _aplicar_tema_global(self, modo: str) -> None:
 		# Desmarca todos antes de aplicar (apenas claro/escuro)
 		for b in [self.btn_tema_claro, self.btn_tema_escuro]:
 			b.setChecked(False)
 		if modo == "escuro":
-			self._ativar_tema_escuro()
 			self.btn_tema_escuro.setChecked(True)
 		elif modo == "claro":
-			self._ativar_tema_claro()
 			self.btn_tema_claro.setChecked(True)
+		else:
+			return
+		# Páginas criadas depois já recebem o novo modo (ver _on_navegar)
 		self._tema_atual = modo
-
-	def _ativar_tema_escuro(self) -> None:
-		QApplication.instance().setPalette(build_palette_escuro())
-		self._atualizar_estilos_tema("escuro")
-		self._ajustar_focus_bloqueado("escuro")
-		self._tema_atual = "escuro"
-		# Atualiza tema da página de gráficos, se existir
+		# Pinta o estado do botão agora: um QTimer.singleShot(0) rodaria antes da
+		# repintura (de baixa prioridade) do clique, deixando a troca sem retorno visual
+		for b in (self.btn_tema_claro, self.btn_tema_escuro):
+			b.repaint()
+		# Palette + QSS global + ajustes por página numa única repintura
+		# (sem quadro intermediário com palette nova e QSS antigo)
+		self.setUpdatesEnabled(False)
 		try:
-			for i in range(self._stack.count()):
-				w = self._stack.widget(i)
-				if getattr(w, "objectName", lambda: "")() == "PaginaGrafico" and hasattr(w, "aplicar_tema"):
-					w.aplicar_tema("escuro")
-		except Exception:
-			pass
-
-	def _ativar_tema_claro(self) -> None:
-		# Modo Claro especial
-		QApplication.instance().setPalette(build_palette_claro())
-		self._atualizar_estilos_tema("claro")
-		self._ajustar_focus_bloqueado("claro")
-		self._tema_atual = "claro"
+			palette = _palette_escuro() if modo == "escuro" else _palette_claro()
+			QApplication.instance().setPalette(palette)
+			self._atualizar_estilos_tema(modo)
+			self._ajustar_focus_bloqueado(modo)
+			self._aplicar_tema_grafico(modo)
+		finally:
+			self.setUpdatesEnabled(True)
+
+	def _on_tema_clicked(self, btn: QPushButton) -> None:
+		self._aplicar_tema_global(btn.property("modo"))
+
+	def _aplicar_tema_grafico(self, modo: str) -> None:
 		# Atualiza tema da página de gráficos, se existir
-		try:
-			for i in range(self._stack.count()):
-				w = self._stack.widget(i)
-				if getattr(w, "objectName", lambda: "")() == "PaginaGrafico" and hasattr(w, "aplicar_tema"):
-					w.aplicar_tema("claro")
-		except Exception:
-			pass
+		w = self._paginas_ref.get("Grafico")
+		if w is not None and hasattr(w, "aplicar_tema"):
+			try:
+				w.aplicar_tema(modo)
+			except Exception:
+				pass
 
 	# Modo sem tema removido
 
 	def _atualizar_estilos_tema(self, modo: str) -> None:
 		"""Reaplica o stylesheet global a partir da base, evitando acúmulo de QSS.
 
-		- Sempre recompõe: base_global + QSS_SLIMBAR_BASE + overrides do tema
+		- Compõe base_global + QSS_SLIMBAR_BASE + overrides do tema (em cache por modo)
+		- Não reaplica quando o modo já está ativo
 		- Depois, aplica QSS específico por página (Consultas) com precedência local
 		"""
-		base = getattr(self, "_stylesheet_base", "") or ""
-		qss_global = base + QSS_SLIMBAR_BASE + qss_tema_extra(modo)
-		self.setStyleSheet(qss_global)
-		# Re-polish do main window para garantir refresh imediato do QSS
-		self.style().unpolish(self)
-		self.style().polish(self)
+		if getattr(self, "_qss_modo_atual", None) != modo:
+			# QSS composto por modo fica em cache; a base não muda após _aplicar_estilo_slimbar
+			qss_global = self._qss_cache.get(modo)
+			if qss_global is None:
+				base = getattr(self, "_stylesheet_base", "") or ""
+				qss_global = base + QSS_SLIMBAR_BASE + qss_tema_extra(modo)
+				self._qss_cache[modo] = qss_global
+			self.setStyleSheet(qss_global)
+			self._qss_modo_atual = modo
+			# Re-polish do main window para garantir refresh imediato do QSS
+			self.style().unpolish(self)
+			self.style().polish(self)
 		# Atualiza também o QSS da página Consultas com precedência local
 		self._aplicar_qss_consultas_por_tema(modo)
 
 	def _aplicar_qss_consultas_por_tema(self, modo: str) -> None:
 		"""Aplica o QSS da página Consultas conforme o tema, com prioridade no próprio widget."""
-		consultas_qss_escuro = (
-			"""
-			#PaginaConsultas QLineEdit { padding:6px 8px; }
-			#TabelaConsultas { background:#403f3f; border:1px solid #b7d9ef; gridline-color:#bababa; color:#fff; alternate-background-color:#292929; }
-			#TabelaConsultas QHeaderView::section { background:qlineargradient(x1:0,y1:0,x2:0,y2:1, stop:0 #001d2e, stop:1 #001724); color:#ffffff; padding:4px 6px; border:1px solid #002336; font-weight:600; }
-			#StatusConsultaLabel { color:#666; padding:4px 2px; }
-			"""
-		)
-		for i in range(self._stack.count()):
-			w = self._stack.widget(i)
-			if w and getattr(w, "objectName", lambda: None)() == "PaginaConsultas":
-				if modo == "escuro":
-					w.setStyleSheet(consultas_qss_escuro)
-				else:
-					w.setStyleSheet(QSS_CONSULTAS_PAGE)
-				# Re-polish garante aplicação imediata
-				w.style().unpolish(w)
-				w.style().polish(w)
-				break
+		qss = _QSS_CONSULTAS_ESCURO if modo == "escuro" else QSS_CONSULTAS_PAGE
+		w = self._paginas_ref.get("Consultas")
+		# Placeholder (módulo indisponível) não recebe o QSS da página
+		if w is None or w.objectName() != "PaginaConsultas":
+			return
+		# Evita reparse/re-polish quando o QSS já é o do tema atual
+		if getattr(w, "_qss_modo", None) != modo:
+			w.setStyleSheet(qss)
+			w._qss_modo = modo
+			# Re-polish garante aplicação imediata
+			w.style().unpolish(w)
+			w.style().polish(w)
 
 	def _ajustar_focus_bloqueado(self, modo: str) -> None:
 		"""Garante que o foco dos campos do formulário Bloqueado use cores corretas por tema.
@@ -1218,29 +1320,24 @@ class MainWindow(QMainWindow):
 		O stylesheet local do formulário define um fundo azul (#eef7ff) no foco. Aqui
 		sobrescrevemos após mudança de tema para evitar conflito de precedência.
 		"""
-		for i in range(self._stack.count()):
-			w = self._stack.widget(i)
-			# Detecta a página Bloqueado sem depender do nome da classe antiga
-			is_bloqueado = False
-			try:
-				from bloqueado import BloqueadoPage  # type: ignore
-				is_bloqueado = isinstance(w, BloqueadoPage)
-			except Exception:
-				# fallback por objectName
-				is_bloqueado = getattr(w, "objectName", lambda: "")() in {"PaginaBloqueado", "PaginaBloqueadoPage"}
-			if is_bloqueado:
-				# Guarda base (sem overrides dinâmicos) apenas uma vez
-				if not hasattr(w, "_base_stylesheet"):
-					w._base_stylesheet = w.styleSheet()
-				# Inclui também os extras do tema (garante que HeaderBloqueado no escuro
-				# sobrescreva o QSS base aplicado localmente no widget)
-				override_focus = qss_focus_override(modo)
-				override_tema = qss_tema_extra(modo)
-				w.setStyleSheet(w._base_stylesheet + override_tema + override_focus)
-				# Re-polish garante refresh imediato
-				w.style().unpolish(w)
-				w.style().polish(w)
-				break
+		w = self._paginas_ref.get("Bloqueado")
+		# Placeholder (módulo indisponível) não recebe os overrides
+		if w is None or w.objectName() not in _BLOQUEADO_OBJNAMES:
+			return
+		# Guarda base (sem overrides dinâmicos) apenas uma vez
+		if not hasattr(w, "_base_stylesheet"):
+			w._base_stylesheet = w.styleSheet()
+			w._qss_por_modo = {}
+		# Inclui também os extras do tema (garante que HeaderBloqueado no escuro
+		# sobrescreva o QSS base aplicado localmente no widget)
+		qss = w._qss_por_modo.get(modo)
+		if qss is None:
+			qss = w._base_stylesheet + qss_tema_extra(modo) + qss_focus_override(modo)
+			w._qss_por_modo[modo] = qss
+		w.setStyleSheet(qss)
+		# Re-polish garante refresh imediato
+		w.style().unpolish(w)
+		w.style().polish(w)
 
 	def _alterar_senha(self) -> None:
 		user = self.CURRENT_USER
@@ -1256,27 +1353,49 @@ class MainWindow(QMainWindow):
 		if nova != conf:
 			QMessageBox.warning(self, "Aviso", "Nova senha e confirmação não conferem.")
 			return
-		try:
-			from database import alterar_senha
-			sucesso = alterar_senha(username=user, senha_atual=atual, nova_senha=nova)
-		except ValueError as exc:
-			QMessageBox.critical(self, "Erro", str(exc))
+		# Verificação + novo hash bcrypt rodam no QThreadPool
+		self.btn_salvar_senha.setEnabled(False)
+		self._executar_db(
+			alterar_senha, self._on_senha_alterada, username=user, senha_atual=atual, nova_senha=nova
+		)
+
+	def _on_senha_alterada(self, resultado: tuple) -> None:
+		self.btn_salvar_senha.setEnabled(True)
+		ok, valor = resultado
+		if not ok:
+			self._mostrar_erro_db(valor)
 			return
-		if not sucesso:
+		if not valor:
 			QMessageBox.critical(self, "Erro", "Senha atual incorreta.")
 			return
+		# Limpa os três campos com um único repaint (antes do aviso modal)
+		self.setUpdatesEnabled(False)
+		for ed in (self.ed_senha_atual, self.ed_nova_senha, self.ed_conf_nova):
+			ed.clear()
+		self.setUpdatesEnabled(True)
 		QMessageBox.information(self, "Sucesso", "Senha alterada.")
-		self.ed_senha_atual.clear()
-		self.ed_nova_senha.clear()
-		self.ed_conf_nova.clear()
 
 	def _on_navegar(self, nome: str) -> None:
 		# Atualiza botão selecionado e muda página
 		btn = self._botoes.get(nome)
 		if btn and not btn.isChecked():
 			btn.setChecked(True)
-		indice = self.SECOES.index(nome)
-		self._stack.setCurrentIndex(indice)
+		pagina = self._paginas_ref.get(nome)
+		if pagina is None:
+			pagina = self._construir_pagina(nome)
+			self._stack.addWidget(pagina)
+			self._paginas_ref[nome] = pagina
+			# Página criada após a aplicação do tema: aplica os ajustes específicos por página
+			modo = getattr(self, "_tema_atual", None)
+			if modo:
+				self._aplicar_qss_consultas_por_tema(modo)
+				self._ajustar_focus_bloqueado(modo)
+				self._aplicar_tema_grafico(modo)
+		if self._stack.currentWidget() is not pagina:  # clique na seção já ativa não faz nada
+			self._stack.setCurrentWidget(pagina)
+
+	def _on_nav_clicked(self, btn: QPushButton) -> None:
+		self._on_navegar(btn.property("secao"))
 
 	def _selecionar_secao_inicial(self, nome: str) -> None:
 		self._on_navegar(nome)
@@ -1284,7 +1403,10 @@ class MainWindow(QMainWindow):
 	def _aplicar_estilo_slimbar(self) -> None:
 		if not hasattr(self, "_stylesheet_base"):
 			self._stylesheet_base = self.styleSheet()
-		self.setStyleSheet(self._stylesheet_base + QSS_SLIMBAR_BASE)
+		qss = self._stylesheet_base + QSS_SLIMBAR_BASE
+		if self.styleSheet() != qss:  # evita re-parse de um QSS idêntico
+			self.setStyleSheet(qss)
+		self._qss_modo_atual = None
 
 	def _set_window_icon(self) -> None:
 		self.setWindowIcon(_get_app_icon())
@@ -1292,6 +1414,65 @@ class MainWindow(QMainWindow):
 
 # ------------------------- Login / Registro ------------------------- #
 
+# Paletas são determinísticas: construídas uma vez por processo (QPalette é compartilhada implicitamente)
+_palette_claro = lru_cache(maxsize=1)(build_palette_claro)
+_palette_escuro = lru_cache(maxsize=1)(build_palette_escuro)
+
+
+# init_db roda em segundo plano enquanto o diálogo de login é montado/exibido;
+# quem precisa do banco antes da janela principal chama _aguardar_init_db()
+class _ErroInicializacaoBanco(Exception):
+	"""init_db falhou (em segundo plano); relançada por _aguardar_init_db."""
+
+
+_init_db_thread: Optional[threading.Thread] = None
+_init_db_erro: Optional[Exception] = None
+
+
+def _init_db_seguro() -> None:
+	global _init_db_erro
+	try:
+		init_db()
+	except Exception as exc:  # pragma: no cover
+		_init_db_erro = exc
+
+
+def _iniciar_init_db() -> None:
+	global _init_db_thread
+	if _init_db_thread is not None:
+		return  # já iniciado neste processo
+	_init_db_thread = threading.Thread(target=_init_db_seguro, name="init_db", daemon=True)
+	_init_db_thread.start()
+
+
+def _aguardar_init_db() -> None:
+	if _init_db_thread is not None:
+		_init_db_thread.join()
+	if _init_db_erro is not None:
+		raise _ErroInicializacaoBanco(f"Falha ao inicializar banco: {_init_db_erro}")
+
+
+# Duração mínima (vista pelo usuário) de uma tentativa de login: usuário inexistente
+# (sem bcrypt) e senha errada levam o mesmo tempo, sem revelar quais usuários existem
+_LOGIN_TEMPO_MINIMO = 0.4  # segundos
+
+
+def _mk_button(texto: str, obj_name: str, *, default: bool = False, slot: Optional[Callable] = None) -> QPushButton:
+	"""Botão dos diálogos de autenticação: nome de objeto (QSS), botão padrão do Enter e slot."""
+	b = QPushButton(texto)
+	b.setObjectName(obj_name)
+	b.setDefault(default)
+	b.setAutoDefault(default)
+	if slot is not None:
+		b.clicked.connect(slot)
+	return b
+
+
+def _autenticar_apos_init_db(*, username: str, senha: str) -> bool:
+	_aguardar_init_db()
+	return autenticar_usuario(username=username, senha=senha)
+
+
 class LoginDialog(QDialog):
 	def __init__(self) -> None:
 		super().__init__()
@@ -1299,12 +1480,13 @@ class LoginDialog(QDialog):
 		self.setModal(True)
 		self.setObjectName("AuthDialog")
 		self.setWindowIcon(_get_app_icon())
+		self._task: Optional[_DbTask] = None
 		self._build()
 		self.usuario = None
 
 	def _build(self) -> None:
-		from style import QSS_AUTH_DIALOG
-		self.setStyleSheet(self.styleSheet() + QSS_AUTH_DIALOG)
+		# Diálogo recém-criado não tem QSS próprio: aplica a string constante diretamente
+		self.setStyleSheet(QSS_AUTH_DIALOG)
 		layout = QVBoxLayout(self)
 
 		# Header com ícone e título
@@ -1323,51 +1505,89 @@ class LoginDialog(QDialog):
 		header.addStretch(1)
 		layout.addLayout(header)
 
-		form = QFormLayout()
+		# Formulário fixo de duas linhas: grade simples com coluna de campos elástica
+		form = QGridLayout()
 		self.ed_user = QLineEdit()
 		self.ed_user.setPlaceholderText("Usuário")
 		self.ed_senha = QLineEdit()
 		self.ed_senha.setEchoMode(QLineEdit.EchoMode.Password)
 		self.ed_senha.setPlaceholderText("Senha")
-		form.addRow("Usuário:", self.ed_user)
-		form.addRow("Senha:", self.ed_senha)
+		for linha, (rotulo, campo) in enumerate((("Usuário:", self.ed_user), ("Senha:", self.ed_senha))):
+			form.addWidget(QLabel(rotulo), linha, 0)
+			form.addWidget(campo, linha, 1)
+		form.setColumnStretch(1, 1)
 		layout.addLayout(form)
 
 		row_btns = QHBoxLayout()
-		self.btn_login = QPushButton("Entrar")
-		self.btn_login.setObjectName("Primary")
-		self.btn_registrar = QPushButton("Registrar")
-		self.btn_registrar.setObjectName("Ghost")
 		# Enter deve acionar "Entrar"
-		self.btn_login.setDefault(True)
-		self.btn_login.setAutoDefault(True)
-		self.btn_registrar.setDefault(False)
-		self.btn_registrar.setAutoDefault(False)
-		self.btn_login.clicked.connect(self._do_login)
-		self.btn_registrar.clicked.connect(self._abrir_registro)
+		self.btn_login = _mk_button("Entrar", "Primary", default=True, slot=self._do_login)
+		self.btn_registrar = _mk_button("Registrar", "Ghost", slot=self._abrir_registro)
 		# Enter nos campos também aciona login diretamente
 		self.ed_user.returnPressed.connect(self._do_login)
 		self.ed_senha.returnPressed.connect(self._do_login)
+		# "Entrar" só fica ativo com usuário e senha preenchidos (evita ida ao banco à toa)
+		self.ed_user.textChanged.connect(self._update_login_enabled)
+		self.ed_senha.textChanged.connect(self._update_login_enabled)
+		self.btn_login.setEnabled(False)
 		row_btns.addStretch(1)
 		row_btns.addWidget(self.btn_registrar)
 		row_btns.addWidget(self.btn_login)
 		layout.addLayout(row_btns)
 		self.resize(380, 200)
 
+	def _update_login_enabled(self) -> None:
+		if self._task is None:
+			self.btn_login.setEnabled(bool(self.ed_user.text().strip()) and bool(self.ed_senha.text()))
+
 	def _do_login(self) -> None:
-		from database import autenticar_usuario
+		if self._task is not None:
+			return  # autenticação já em andamento
 		user = self.ed_user.text().strip()
 		senha = self.ed_senha.text()
 		if not user or not senha:
 			QMessageBox.warning(self, "Aviso", "Informe usuário e senha.")
 			return
-		if autenticar_usuario(username=user, senha=senha):
+		# bcrypt + consulta rodam no QThreadPool; o diálogo continua respondendo
+		self._set_autenticando(True)
+		inicio = time.monotonic()
+		self._task = _DbTask(_autenticar_apos_init_db, username=user, senha=senha)
+		self._task.sinais.concluido.connect(lambda resultado, u=user: self._on_auth_done(u, resultado, inicio))
+		QThreadPool.globalInstance().start(self._task)
+
+	def _on_auth_done(self, user: str, resultado: tuple, inicio: float) -> None:
+		# Completa o tempo mínimo com um timer (a thread do pool já foi liberada)
+		restante = _LOGIN_TEMPO_MINIMO - (time.monotonic() - inicio)
+		if restante > 0:
+			QTimer.singleShot(int(restante * 1000), lambda: self._finalizar_auth(user, resultado))
+		else:
+			self._finalizar_auth(user, resultado)
+
+	def _finalizar_auth(self, user: str, resultado: tuple) -> None:
+		self._task = None
+		self._set_autenticando(False)
+		ok, valor = resultado
+		if isinstance(valor, (_ErroInicializacaoBanco, SQLAlchemyError)):
+			QMessageBox.critical(self, "Erro BD", str(valor))
+		elif not ok:
+			QMessageBox.critical(self, "Erro", f"Falha ao autenticar: {valor}")
+		elif valor:
 			self.usuario = user
 			self.accept()
 		else:
 			QMessageBox.critical(self, "Erro", "Credenciais inválidas.")
 
+	def _set_autenticando(self, ativo: bool) -> None:
+		"""Trava o formulário durante a autenticação (uma tentativa por vez)."""
+		self.btn_login.setText("Entrando…" if ativo else "Entrar")
+		for w in (self.btn_login, self.btn_registrar, self.ed_user, self.ed_senha):
+			w.setEnabled(not ativo)
+		if not ativo:
+			self._update_login_enabled()
+			self.ed_senha.setFocus()
+
 	def _abrir_registro(self) -> None:
+		if self._task is not None:
+			return
 		dlg = RegistroUsuarioDialog(parent=self)
 		if dlg.exec():
 			QMessageBox.information(self, "Sucesso", "Usuário registrado. Faça login.")
@@ -1383,8 +1603,8 @@ class RegistroUsuarioDialog(QDialog):
 		self._build()
 
 	def _build(self) -> None:
-		from style import QSS_AUTH_DIALOG
-		self.setStyleSheet(self.styleSheet() + QSS_AUTH_DIALOG)
+		# Diálogo recém-criado não tem QSS próprio: aplica a string constante diretamente
+		self.setStyleSheet(QSS_AUTH_DIALOG)
 		lay = QVBoxLayout(self)
 
 		header = QHBoxLayout()
@@ -1402,7 +1622,7 @@ class RegistroUsuarioDialog(QDialog):
 		header.addStretch(1)
 		lay.addLayout(header)
 
-		form = QFormLayout()
+		form = QGridLayout()
 		self.ed_user = QLineEdit()
 		self.ed_user.setPlaceholderText("Novo usuário")
 		self.ed_senha = QLineEdit()
@@ -1414,27 +1634,36 @@ class RegistroUsuarioDialog(QDialog):
 		self.ed_api = QLineEdit()
 		self.ed_api.setPlaceholderText("API Key de Registro")
 		self.ed_api.setEchoMode(QLineEdit.EchoMode.Password)
-		form.addRow("Usuário:", self.ed_user)
-		form.addRow("Senha:", self.ed_senha)
-		form.addRow("Confirmar:", self.ed_conf)
-		form.addRow("Tipo:", self.cb_tipo)
-		form.addRow("API Key:", self.ed_api)
+		linhas = (
+			("Usuário:", self.ed_user),
+			("Senha:", self.ed_senha),
+			("Confirmar:", self.ed_conf),
+			("Tipo:", self.cb_tipo),
+			("API Key:", self.ed_api),
+		)
+		for linha, (rotulo, campo) in enumerate(linhas):
+			form.addWidget(QLabel(rotulo), linha, 0)
+			form.addWidget(campo, linha, 1)
+		form.setColumnStretch(1, 1)
 		lay.addLayout(form)
 		btns = QHBoxLayout()
-		btn_cancel = QPushButton("Cancelar")
-		btn_cancel.setObjectName("Ghost")
-		btn_ok = QPushButton("Criar")
-		btn_ok.setObjectName("Primary")
-		btn_cancel.clicked.connect(self.reject)
-		btn_ok.clicked.connect(self._criar)
+		btn_cancel = _mk_button("Cancelar", "Ghost", slot=self.reject)
+		self.btn_ok = _mk_button("Criar", "Primary", default=True, slot=self._criar)
+		# "Criar" só fica ativo com usuário/senha preenchidos e confirmação igual à senha
+		for ed in (self.ed_user, self.ed_senha, self.ed_conf):
+			ed.textChanged.connect(self._update_criar_enabled)
+		self.btn_ok.setEnabled(False)
 		btns.addStretch(1)
 		btns.addWidget(btn_cancel)
-		btns.addWidget(btn_ok)
+		btns.addWidget(self.btn_ok)
 		lay.addLayout(btns)
 		self.resize(420, 240)
 
+	def _update_criar_enabled(self) -> None:
+		senha = self.ed_senha.text()
+		self.btn_ok.setEnabled(bool(self.ed_user.text().strip()) and bool(senha) and senha == self.ed_conf.text())
+
 	def _criar(self) -> None:
-		from database import criar_usuario
 		user = self.ed_user.text().strip()
 		senha = self.ed_senha.text()
 		conf = self.ed_conf.text()
@@ -1446,6 +1675,15 @@ class RegistroUsuarioDialog(QDialog):
 			QMessageBox.warning(self, "Aviso", "Senhas não conferem.")
 			return
 		api_key = self.ed_api.text().strip()
+		if not api_key:
+			# Chave vazia nunca confere com a configurada: recusa sem esperar o banco
+			QMessageBox.warning(self, "Aviso", "Informe a API Key de registro.")
+			return
+		try:
+			_aguardar_init_db()
+		except _ErroInicializacaoBanco as exc:
+			QMessageBox.critical(self, "Erro BD", str(exc))
+			return
 		try:
 			criar_usuario(username=user, senha=senha, tipo=tipo, api_key=api_key)
 		except ValueError as exc:
@@ -1461,23 +1699,31 @@ def executar() -> int:
 	except Exception:
 		pass
 	app = QApplication.instance() or QApplication(sys.argv)
-	# Força estilo/paleta independentes do sistema desde o início
-	try:
-		QApplication.setStyle("Fusion")
-		# Garante tema CLARO global (não seguir tema do Windows)
-		QApplication.instance().setPalette(build_palette_claro())
-	except Exception:
-		pass
-	# Inicializa banco
-	try:
-		from database import init_db
-		init_db()
-	except Exception as exc:  # pragma: no cover
-		QMessageBox.critical(None, "Erro BD", f"Falha ao inicializar banco: {exc}")
+	# Força estilo/paleta independentes do sistema desde o início (uma vez por QApplication:
+	# reaplicar reconstrói o estilo e re-polisha todos os widgets existentes)
+	if not app.property("estilo_aplicado"):
+		try:
+			QApplication.setStyle("Fusion")
+			# Garante tema CLARO global (não seguir tema do Windows)
+			app.setPalette(_palette_claro())
+			app.setProperty("estilo_aplicado", True)
+		except Exception:
+			pass
+	if _erro_import_db is not None:  # pragma: no cover
+		QMessageBox.critical(None, "Erro BD", f"Falha ao inicializar banco: {_erro_import_db}")
 		return 1
+	# Inicializa banco em paralelo com a montagem do login (aguardado antes de autenticar)
+	_iniciar_init_db()
 	# Fluxo de login
 	login = LoginDialog()
-	if not login.exec():
+	logado = login.exec()
+	# Mesmo cancelando o login, uma falha de inicialização do banco é reportada (código 1)
+	try:
+		_aguardar_init_db()
+	except _ErroInicializacaoBanco as exc:  # pragma: no cover
+		QMessageBox.critical(None, "Erro BD", str(exc))
+		return 1
+	if not logado:
 		return 0
 	main = MainWindow()
 	main.show()
@@ -78,6 +78,10 @@ QSS_HEADER_BLOQUEADO = """
     border-radius: 18px; 
     padding: 12px 16px; 
 }
+#PaginaBloqueado #HeaderBloqueado {
+    /* Só a página Bloqueado: relevo estático no lugar da sombra (as demais mantêm a sombra) */
+    border-bottom: 2px solid rgba(0,0,0,0.22);
+}
 #TituloWrap { 
     /* Pastilha translúcida para contraste do título */
     background: qlineargradient(x1:0, y1:0, x2:1, y2:1, stop:0 rgba(255,255,255,0.92), stop:1 rgba(255,255,255,0.78)); 
@@ -477,6 +481,9 @@ def qss_tema_extra(modo: str) -> str:
                 border-radius: 18px; 
                 padding: 12px 16px; 
             }
+            #PaginaBloqueado #HeaderBloqueado {
+                border-bottom: 2px solid rgba(0,0,0,0.45);
+            }
             #TituloWrap { 
                 /* Pastilha translúcida para contraste do título */
                 background: qlineargradient(x1:0, y1:0, x2:1, y2:1, stop:0 rgba(255,255,255,0.92), stop:1 rgba(255,255,255,0.78)); 
@@ -670,36 +677,22 @@ def qss_tema_extra(modo: str) -> str:
             }
             QPushButton#ConfigGhostButton:hover { background: rgba(255,255,255,0.08); }
             QPushButton#ConfigGhostButton:pressed { background: rgba(255,255,255,0.12); }
-            QPushButton#ConfigListButton {
-                background: rgba(32,41,58,0.75);
-                border: 1px solid rgba(98,123,168,0.35);
-                border-radius: 10px;
+            QListView#ConfigUserList {
+                border: 1px solid #202a3a;
+                border-radius: 14px;
+                background: rgba(14,19,28,0.65);
                 color: #e8eef9;
-                padding: 8px 14px;
-                text-align: left;
                 font-weight: 600;
+                outline: 0;
             }
-            QPushButton#ConfigListButton:hover { background: rgba(110,168,254,0.18); }
-            QPushButton#ConfigListButton:pressed { background: rgba(110,168,254,0.28); }
-            QPushButton#ConfigListButtonAdmin {
-                background: rgba(255,206,84,0.22);
-                border: 1px solid rgba(255,215,128,0.45);
+            QListView#ConfigUserList::item {
+                border: 1px solid rgba(98,123,168,0.35);
                 border-radius: 10px;
-                color: #ffeca8;
                 padding: 8px 14px;
-                text-align: left;
-                font-weight: 600;
-            }
-            QPushButton#ConfigListButtonAdmin:hover { background: rgba(255,206,84,0.32); }
-            QPushButton#ConfigListButtonAdmin:pressed { background: rgba(255,206,84,0.4); }
-            QScrollArea#ConfigListScroll {
-                border: 1px solid #202a3a;
-                border-radius: 14px;
-                background: rgba(14,19,28,0.65);
-            }
-            QScrollArea#ConfigListScroll QWidget {
-                background: transparent;
             }
+            QListView#ConfigUserList::item:hover { background: rgba(110,168,254,0.18); }
+            QListView#ConfigUserList::item:selected { background: rgba(110,168,254,0.28); color: #ffffff; }
+            QListView#ConfigUserList::item:disabled { border: none; color: #9ba9c4; font-style: italic; }
             #ConfigDialogHeader {
                 background: qlineargradient(x1:0,y1:0,x2:1,y2:1, stop:0 #1c2432, stop:1 #28374d);
                 border-radius: 18px;
@@ -926,36 +919,22 @@ def qss_tema_extra(modo: str) -> str:
         }
         QPushButton#ConfigGhostButton:hover { background: rgba(36,97,255,0.12); }
         QPushButton#ConfigGhostButton:pressed { background: rgba(36,97,255,0.18); }
-        QPushButton#ConfigListButton {
-            background: rgba(235,242,255,0.92);
-            border: 1px solid rgba(32,123,255,0.2);
-            border-radius: 10px;
+        QListView#ConfigUserList {
+            border: 1px solid #d6e2f6;
+            border-radius: 14px;
+            background: rgba(244,248,255,0.8);
             color: #1f3552;
-            padding: 8px 14px;
-            text-align: left;
             font-weight: 600;
+            outline: 0;
         }
-        QPushButton#ConfigListButton:hover { background: rgba(32,123,255,0.18); }
-        QPushButton#ConfigListButton:pressed { background: rgba(32,123,255,0.28); }
-        QPushButton#ConfigListButtonAdmin {
-            background: rgba(255,248,205,0.98);
-            border: 1px solid rgba(255,193,7,0.4);
+        QListView#ConfigUserList::item {
+            border: 1px solid rgba(32,123,255,0.2);
             border-radius: 10px;
-            color: #7a4f00;
             padding: 8px 14px;
-            text-align: left;
-            font-weight: 600;
-        }
-        QPushButton#ConfigListButtonAdmin:hover { background: rgba(255,213,79,0.32); }
-        QPushButton#ConfigListButtonAdmin:pressed { background: rgba(255,213,79,0.4); }
-        QScrollArea#ConfigListScroll {
-            border: 1px solid #d6e2f6;
-            border-radius: 14px;
-            background: rgba(244,248,255,0.8);
-        }
-        QScrollArea#ConfigListScroll QWidget {
-            background: transparent;
         }
+        QListView#ConfigUserList::item:hover { background: rgba(32,123,255,0.18); }
+        QListView#ConfigUserList::item:selected { background: rgba(32,123,255,0.28); color: #10223b; }
+        QListView#ConfigUserList::item:disabled { border: none; color: #7a889f; font-style: italic; }
         #ConfigDialogHeader {
             background: qlineargradient(x1:0,y1:0,x2:1,y2:1, stop:0 #e8f0ff, stop:1 #d4e4ff);
             border-radius: 18px;